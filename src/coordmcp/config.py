@@ -30,6 +30,9 @@ class Config:
     lock_timeout_hours: int = 24
     auto_cleanup_stale_locks: bool = True
     
+    # Storage
+    storage_durability: str = "none"
+    
     # Features
     enable_compression: bool = False
     
@@ -94,6 +97,9 @@ def load_config() -> Config:
     if timeout := os.getenv("COORDMCP_LOCK_TIMEOUT_HOURS"):
         config.lock_timeout_hours = int(timeout)
     
+    if durability := os.getenv("COORDMCP_STORAGE_DURABILITY"):
+        config.storage_durability = durability.lower()
+    
     if enable_compression := os.getenv("COORDMCP_ENABLE_COMPRESSION"):
         config.enable_compression = enable_compression.lower() == "true"
     
@@ -308,33 +308,56 @@ class FileTracker:
             "stale_locks_removed": len(stale_locks)
         }
     
-    def is_locked(self, project_id: str, file_path: str) -> bool:
+    def get_lock(self, project_id: str, file_path: str) -> Optional[LockInfo]:
         """
-        Check if a file is locked.
+        Get the lock on a file.
+        
+        Only the requested lock is parsed, not every lock in the project.
         
         Args:
             project_id: Project ID
             file_path: File path to check
             
         Returns:
-            True if locked (and not stale)
+            LockInfo, or None if not locked (stale locks are cleaned up)
         """
-        locks = self._load_project_locks(project_id)
+        data = self.backend.load(self._get_project_locks_key(project_id))
+        if not data or "locks" not in data:
+            return None
         
         normalized_path = _normalize_file_path(file_path)
-        if normalized_path not in locks:
-            return False
+        lock_data = data["locks"].get(normalized_path)
+        if lock_data is None:
+            return None
         
-        lock_info = locks[normalized_path]
+        try:
+            lock_info = LockInfo.model_validate(lock_data)
+        except Exception as e:
+            logger.warning(f"Failed to parse lock for {normalized_path}: {e}")
+            return None
         
         # Check if stale
         if lock_info.is_stale(self.config.lock_timeout_hours):
             # Clean up stale lock
-            del locks[normalized_path]
+            locks = self._load_project_locks(project_id)
+            locks.pop(normalized_path, None)
             self._save_project_locks(project_id, locks)
-            return False
+            return None
         
-        return True
+        return lock_info
+    
+    def is_locked(self, project_id: str, file_path: str) -> bool:
+        """
+        Check if a file is locked.
+        
+        Args:
+            project_id: Project ID
+            file_path: File path to check
+            
+        Returns:
+            True if locked (and not stale)
+        """
+        return self.get_lock(project_id, file_path) is not None
     
     def get_lock_holder(self, project_id: str, file_path: str) -> Optional[str]:
         """
@@ -347,21 +370,8 @@ class FileTracker:
         Returns:
             Agent ID or None if not locked
         """
-        locks = self._load_project_locks(project_id)
-        
-        normalized_path = _normalize_file_path(file_path)
-        if normalized_path not in locks:
-            return None
-        
-        lock_info = locks[normalized_path]
-        
-        # Check if stale
-        if lock_info.is_stale(self.config.lock_timeout_hours):
-            del locks[normalized_path]
-            self._save_project_locks(project_id, locks)
-            return None
-        
-        return lock_info.locked_by
+        lock_info = self.get_lock(project_id, file_path)
+        return lock_info.locked_by if lock_info else None
     
     def cleanup_stale_locks(self, project_id: str) -> int:
         """
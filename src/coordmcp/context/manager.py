@@ -6,6 +6,8 @@ from datetime import datetime
 from typing import List, Optional, Dict
 from uuid import uuid4
 
+from pydantic import TypeAdapter, ValidationError
+
 from coordmcp.storage.base import StorageBackend
 from coordmcp.context.state import (
     AgentContext, AgentProfile, CurrentContext, ProjectActivity,
@@ -19,6 +21,10 @@ from coordmcp.events import event_manager, EventType
 
 logger = get_logger("context.manager")
 
+# Validates/dumps the whole agent registry in a single call instead of one
+# model_validate()/model_dump() per profile.
+_AGENT_REGISTRY_ADAPTER = TypeAdapter(Dict[str, AgentProfile])
+
 
 class ContextManager:
     """Manages agent contexts, registration, and context switching."""
@@ -51,6 +57,12 @@ class ContextManager:
         if not data or "agents" not in data:
             return {}
         
+        try:
+            return _AGENT_REGISTRY_ADAPTER.validate_python(data["agents"])
+        except ValidationError:
+            pass
+        
+        # Fall back to per-profile validation so one bad entry doesn't hide the rest
         registry = {}
         for agent_id, agent_data in data["agents"].items():
             try:
@@ -65,7 +77,7 @@ class ContextManager:
         key = self._get_agent_registry_key()
         
         data = {
-            "agents": {agent_id: profile.model_dump() for agent_id, profile in registry.items()},
+            "agents": _AGENT_REGISTRY_ADAPTER.dump_python(registry),
             "updated_at": datetime.now().isoformat()
         }
         
@@ -169,8 +181,17 @@ class ContextManager:
     
     def get_agent(self, agent_id: str) -> Optional[AgentProfile]:
         """Get an agent's profile from the registry."""
-        registry = self._load_agent_registry()
-        return registry.get(agent_id)
+        data = self.backend.load(self._get_agent_registry_key())
+        
+        if not data or agent_id not in data.get("agents", {}):
+            return None
+        
+        # Only validate the requested profile, not the whole registry
+        try:
+            return AgentProfile.model_validate(data["agents"][agent_id])
+        except Exception as e:
+            logger.warning(f"Failed to parse agent profile for {agent_id}: {e}")
+            return None
     
     def get_all_agents(self) -> List[AgentProfile]:
         """Get all registered agents."""
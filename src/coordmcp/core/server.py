@@ -19,7 +19,11 @@ def get_storage() -> JSONStorageBackend:
     global _storage_instance
     if _storage_instance is None:
         config = get_config()
-        _storage_instance = JSONStorageBackend(config.data_dir)
+        _storage_instance = JSONStorageBackend(
+            config.data_dir,
+            durability=config.storage_durability,
+            compression=config.enable_compression
+        )
         logger.info("Storage backend initialized")
     return _storage_instance
 
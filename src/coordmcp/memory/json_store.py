@@ -3,7 +3,7 @@ Project memory store implementation for CoordMCP.
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from coordmcp.storage.base import StorageBackend
@@ -99,28 +99,61 @@ class ProjectMemoryStore:
             created_by="system"
         )
         
-        # Save project info
-        self.backend.save(
-            self._get_project_key(project_id),
-            project_info.model_dump()
-        )
-        
-        # Initialize empty collections with schema version
-        self.backend.save(self._get_decisions_key(project_id), {"_schema_version": SCHEMA_VERSION, "decisions": {}})
-        self.backend.save(self._get_tech_stack_key(project_id), {"_schema_version": SCHEMA_VERSION, "tech_stack": {}})
-        self.backend.save(self._get_changes_key(project_id), {"_schema_version": SCHEMA_VERSION, "changes": []})
-        self.backend.save(self._get_file_metadata_key(project_id), {"_schema_version": SCHEMA_VERSION, "files": {}})
-        self.backend.save(self._get_architecture_key(project_id), {"_schema_version": SCHEMA_VERSION, "architecture": {}})
-        self.backend.save(self._get_relationships_key(project_id), {"_schema_version": SCHEMA_VERSION, "relationships": []})
-        
-        # Initialize indexes
-        self.backend.save(self._get_decisions_index_key(project_id), {"_schema_version": SCHEMA_VERSION, "index": DecisionIndex().model_dump()})
-        self.backend.save(self._get_changes_index_key(project_id), {"_schema_version": SCHEMA_VERSION, "index": ChangeIndex().model_dump()})
-        self.backend.save(self._get_file_index_key(project_id), {"_schema_version": SCHEMA_VERSION, "index": FileMetadataIndex().model_dump()})
+        # Save project info, empty collections and indexes
+        for key, data in self._new_project_records(project_info).items():
+            self.backend.save(key, data)
         
         logger.info(f"Created project '{project_name}' with ID {project_id}")
         return project_id
     
+    def create_projects_bulk(self, projects: List[Tuple[str, str]]) -> List[str]:
+        """
+        Create several projects with a single batch write.
+        
+        Args:
+            projects: (project_name, workspace_path) pairs
+            
+        Returns:
+            Project IDs, in the same order as ``projects``
+        """
+        project_ids = []
+        items: Dict[str, Dict[str, Any]] = {}
+        
+        for project_name, workspace_path in projects:
+            project_id = str(uuid4())
+            project_info = ProjectInfo(
+                id=project_id,
+                project_id=project_id,
+                project_name=project_name,
+                workspace_path=workspace_path,
+                created_by="system"
+            )
+            items.update(self._new_project_records(project_info))
+            project_ids.append(project_id)
+        
+        self.backend.batch_save(items)
+        
+        logger.info(f"Created {len(project_ids)} projects")
+        return project_ids
+    
+    def _new_project_records(self, project_info: ProjectInfo) -> Dict[str, Dict[str, Any]]:
+        """Build the storage records for a new project: info, empty collections and indexes."""
+        project_id = project_info.project_id
+        return {
+            self._get_project_key(project_id): project_info.model_dump(),
+            # Empty collections with schema version
+            self._get_decisions_key(project_id): {"_schema_version": SCHEMA_VERSION, "decisions": {}},
+            self._get_tech_stack_key(project_id): {"_schema_version": SCHEMA_VERSION, "tech_stack": {}},
+            self._get_changes_key(project_id): {"_schema_version": SCHEMA_VERSION, "changes": []},
+            self._get_file_metadata_key(project_id): {"_schema_version": SCHEMA_VERSION, "files": {}},
+            self._get_architecture_key(project_id): {"_schema_version": SCHEMA_VERSION, "architecture": {}},
+            self._get_relationships_key(project_id): {"_schema_version": SCHEMA_VERSION, "relationships": []},
+            # Indexes
+            self._get_decisions_index_key(project_id): {"_schema_version": SCHEMA_VERSION, "index": DecisionIndex().model_dump()},
+            self._get_changes_index_key(project_id): {"_schema_version": SCHEMA_VERSION, "index": ChangeIndex().model_dump()},
+            self._get_file_index_key(project_id): {"_schema_version": SCHEMA_VERSION, "index": FileMetadataIndex().model_dump()},
+        }
+    
     def project_exists(self, project_id: str) -> bool:
         """Check if a project exists."""
         return self.backend.exists(self._get_project_key(project_id))
@@ -1162,6 +1195,38 @@ class ProjectMemoryStore:
         logger.info(f"Created task {task.id}: {task.title}")
         return task.id
     
+    def create_tasks(self, tasks: List['Task']) -> List[str]:
+        """
+        Create several tasks, with one read and one write per project.
+        
+        Args:
+            tasks: Tasks to create
+            
+        Returns:
+            Task IDs, in the same order as ``tasks``
+        """
+        by_project: Dict[str, List['Task']] = {}
+        for task in tasks:
+            by_project.setdefault(task.project_id, []).append(task)
+        
+        for project_id in by_project:
+            if not self.project_exists(project_id):
+                raise ValueError(f"Project {project_id} does not exist")
+        
+        for project_id, project_tasks in by_project.items():
+            key = self._get_tasks_key(project_id)
+            data = self.backend.load(key) or {"_schema_version": SCHEMA_VERSION, "tasks": {}}
+            
+            if "tasks" not in data:
+                data["tasks"] = {}
+            
+            for task in project_tasks:
+                data["tasks"][task.id] = task.model_dump()
+            self.backend.save(key, data)
+        
+        logger.info(f"Created {len(tasks)} tasks")
+        return [task.id for task in tasks]
+    
     def get_task(self, project_id: str, task_id: str) -> Optional['Task']:
         """
         Get a task by ID.
@@ -1411,6 +1476,43 @@ class ProjectMemoryStore:
 
         return message.id
 
+    def send_messages(self, messages: List['AgentMessage']) -> List[str]:
+        """
+        Send several messages, with one read and one write per project.
+
+        Args:
+            messages: AgentMessages to send, in order
+
+        Returns:
+            Message IDs, in the same order as ``messages``
+        """
+        by_project: Dict[str, List['AgentMessage']] = {}
+        for message in messages:
+            by_project.setdefault(message.project_id, []).append(message)
+
+        for project_id in by_project:
+            if not self.project_exists(project_id):
+                raise ValueError(f"Project {project_id} does not exist")
+
+        for project_id, project_messages in by_project.items():
+            key = self._get_messages_key(project_id)
+            data = self.backend.load(key) or {"_schema_version": SCHEMA_VERSION, "messages": []}
+
+            if "messages" not in data:
+                data["messages"] = []
+
+            data["messages"].extend(message.model_dump() for message in project_messages)
+
+            # Keep only last 100 messages per project
+            if len(data["messages"]) > 100:
+                data["messages"] = data["messages"][-100:]
+
+            self.backend.save(key, data)
+
+        logger.info(f"Sent {len(messages)} messages")
+
+        return [message.id for message in messages]
+
     def get_messages(self, project_id: str, agent_id: str,
                      unread_only: bool = False, limit: int = 50) -> List['AgentMessage']:
         """
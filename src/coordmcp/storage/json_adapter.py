@@ -2,43 +2,186 @@
 JSON file-based storage adapter for CoordMCP.
 """
 
+import asyncio
 import json
+import math
 import os
+import string
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
 from coordmcp.storage.base import StorageBackend
 from coordmcp.logger import get_logger
 
+try:
+    # Optional C accelerator, installed with the "fast" extra
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional zstd bindings, installed with the "compression" extra
+    import zstandard
+except ImportError:
+    zstandard = None
+
 logger = get_logger("storage.json")
 
+# "none": atomic rename only, data may sit in the OS page cache after save()
+# "sync": fsync the file and its directory before save() returns
+DURABILITY_MODES = ("none", "sync")
+
+# With compression enabled, encoded payloads larger than this are stored as
+# a zstd frame instead of plain JSON text
+COMPRESSION_THRESHOLD = 4096
+COMPRESSION_LEVEL = 3
+
+# Every zstd frame starts with this magic number; JSON text never does, so
+# plain and compressed files can be told apart without a header of our own
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Worker threads in the dedicated pool used by the *_async methods
+IO_POOL_WORKERS = 8
+
+# ASCII characters allowed in keys; non-ASCII keys fall back to str.isalnum()
+_KEY_CHARS = frozenset(string.ascii_letters + string.digits + "_-/")
+
+
+def _is_valid_key_format(key: str) -> bool:
+    """Check that a key only contains word characters, hyphens and forward slashes."""
+    if not key:
+        return False
+    if key.isascii():
+        return _KEY_CHARS.issuperset(key)
+    return all(c.isalnum() or c in "_-/" for c in key)
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback for values json cannot encode: enums by value, anything else as str()."""
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+# Types that never hold a float; skipped without further checks
+_SCALAR_TYPES = frozenset({str, int, bool, type(None), datetime})
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Check whether data contains a NaN or infinite float anywhere."""
+    stack = [data]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        obj = pop()
+        t = type(obj)
+        if t in _SCALAR_TYPES:
+            continue
+        # Exact types first; the isinstance checks cover subclasses
+        if t is dict:
+            extend(obj.values())
+        elif t is list or t is tuple:
+            extend(obj)
+        elif isinstance(obj, float):
+            if not math.isfinite(obj):
+                return True
+        elif isinstance(obj, dict):
+            extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            extend(obj)
+    return False
+
+
+def _encode(data: Dict[str, Any]) -> bytes:
+    """
+    Serialize data to indented UTF-8 JSON bytes.
+    
+    Uses orjson when available. Both encoders write the same values: non-ASCII
+    text as raw UTF-8, enums by value, datetimes and other objects via str().
+    Only float spelling may differ (``1e16`` vs ``1e+16``). orjson writes NaN
+    and infinity as null, so when its output contains null and the data holds
+    such a float, the stdlib encoder is used instead, which keeps them.
+    """
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(
+                data,
+                default=_json_default,
+                option=(
+                    orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_PASSTHROUGH_DATACLASS
+                )
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles these
+            encoded = None
+        if encoded is not None and (b"null" not in encoded or not _has_non_finite(data)):
+            return encoded
+    return json.dumps(data, indent=2, default=_json_default, ensure_ascii=False).encode("utf-8")
+
+
+def _decode(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # The stdlib parser also accepts NaN/Infinity written by json.dumps
+            pass
+    return json.loads(raw)
+
 
 class JSONStorageBackend(StorageBackend):
     """JSON file-based storage implementation."""
     
-    def __init__(self, base_dir: Path):
+    def __init__(self, base_dir: Path, durability: str = "none", compression: bool = False):
         """
         Initialize JSON storage backend.
         
         Args:
             base_dir: Base directory for all JSON files
+            durability: Write durability mode, one of DURABILITY_MODES
+            compression: zstd-compress payloads larger than COMPRESSION_THRESHOLD
         """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Invalid durability mode '{durability}'. Must be one of: {', '.join(DURABILITY_MODES)}")
+        
+        if compression and zstandard is None:
+            logger.warning("Compression requested but 'zstandard' is not installed; storing plain JSON")
+            compression = False
+        
         self.base_dir = Path(base_dir)
+        self.durability = durability
+        self.compression = compression
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Created on first async call so sync-only users never start threads
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._io_pool_lock = threading.Lock()
+        
         logger.info(f"JSON storage initialized at {self.base_dir}")
     
-    def _get_file_path(self, key: str) -> Path:
-        """Convert key to file path with security validation."""
-        import re
+    def _get_file_path(self, key: str, create_dirs: bool = False) -> Path:
+        """
+        Convert key to file path with security validation.
         
+        Args:
+            key: Storage key
+            create_dirs: Create missing parent directories (only needed for writes)
+        """
         # Security: Prevent path traversal attacks
         if ".." in key or key.startswith("/") or key.startswith("\\"):
             raise ValueError(f"Invalid key contains path traversal attempt: {key}")
         
         # Security: Sanitize key to prevent directory traversal
         # Only allow alphanumeric characters, hyphens, underscores, and forward slashes
-        if not re.match(r'^[\w\-/]+$', key):
+        if not _is_valid_key_format(key):
             raise ValueError(f"Invalid key format. Key must contain only alphanumeric characters, hyphens, underscores, and forward slashes: {key}")
         
         # Replace path separators with underscores for flat storage
@@ -51,10 +194,23 @@ class JSONStorageBackend(StorageBackend):
                     raise ValueError(f"Invalid directory component in key: {key}")
             
             dir_path = self.base_dir / "/".join(parts[:-1])
-            dir_path.mkdir(parents=True, exist_ok=True)
+            if create_dirs:
+                dir_path.mkdir(parents=True, exist_ok=True)
             return dir_path / f"{parts[-1]}.json"
         return self.base_dir / f"{key}.json"
     
+    def _fsync_dir(self, dir_path: Path) -> None:
+        """Flush a directory entry so a completed rename survives a crash."""
+        # Directories cannot be opened for fsync on Windows
+        if os.name == "nt":
+            return
+        
+        fd = os.open(dir_path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
     def save(self, key: str, data: Dict[str, Any]) -> bool:
         """Save data to JSON file with atomic write."""
         try:
@@ -67,15 +223,35 @@ class JSONStorageBackend(StorageBackend):
                 logger.error("Invalid data: data must be a dictionary")
                 return False
             
-            file_path = self._get_file_path(key)
-            temp_path = file_path.with_suffix('.tmp')
+            file_path = self._get_file_path(key, create_dirs=True)
+            
+            payload = _encode(data)
+            if self.compression and len(payload) > COMPRESSION_THRESHOLD:
+                payload = zstandard.compress(payload, COMPRESSION_LEVEL)
             
-            # Write to temp file first (atomic operation)
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+            # Write to a temp file first (atomic operation). Each save gets its
+            # own, so concurrent saves of one key never write the same file.
+            fd, temp_name = tempfile.mkstemp(
+                dir=file_path.parent, prefix=f"{file_path.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                    if self.durability == "sync":
+                        f.flush()
+                        os.fsync(f.fileno())
+                
+                # Rename temp file to actual file (atomic on most systems)
+                os.replace(temp_name, file_path)
+            except BaseException:
+                try:
+                    os.unlink(temp_name)
+                except OSError:
+                    pass
+                raise
             
-            # Rename temp file to actual file (atomic on most systems)
-            os.replace(temp_path, file_path)
+            if self.durability == "sync":
+                self._fsync_dir(file_path.parent)
             
             logger.debug(f"Saved data for key '{key}'")
             return True
@@ -96,13 +272,22 @@ class JSONStorageBackend(StorageBackend):
                 logger.debug(f"No data found for key '{key}'")
                 return None
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            
+            # Compressed files are readable even if compression was turned off since
+            if raw.startswith(_ZSTD_MAGIC):
+                if zstandard is None:
+                    logger.error(f"Data for key '{key}' is zstd-compressed but 'zstandard' is not installed")
+                    return None
+                raw = zstandard.decompress(raw)
+            
+            data = _decode(raw)
             
             logger.debug(f"Loaded data for key '{key}'")
             return data
             
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             logger.error(f"Corrupted JSON data for key '{key}': {e}")
             return None
         except ValueError as e:
@@ -146,19 +331,41 @@ class JSONStorageBackend(StorageBackend):
         
         if prefix:
             search_dir = self.base_dir / prefix
+            key_prefix = Path(prefix).as_posix().strip("/") + "/"
         else:
             search_dir = self.base_dir
+            key_prefix = ""
         
-        if not search_dir.exists():
+        if not search_dir.is_dir():
             return keys
         
-        for json_file in search_dir.rglob("*.json"):
-            # Convert file path back to key
-            relative_path = json_file.relative_to(self.base_dir)
-            key = str(relative_path.with_suffix('')).replace(os.sep, '/')
-            keys.append(key)
+        # Walk with os.scandir: one listing call per directory, and entry types
+        # come from the directory read instead of a stat per file.
+        #
+        # Each directory's entries are sorted on their own and visited depth
+        # first, which emits keys already in global order: a directory sorts
+        # as "name/", the common prefix of every key below it. That replaces
+        # one O(N log N) sort of all keys with small per-directory sorts.
+        pending = [(key_prefix, str(search_dir))]
+        while pending:
+            entry_key, dir_path = pending.pop()
+            if dir_path is None:
+                keys.append(entry_key)
+                continue
+            
+            children = []
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        children.append((f"{entry_key}{entry.name}/", entry.path))
+                    elif entry.name.endswith(".json") and entry.is_file():
+                        children.append((entry_key + entry.name[:-5], None))
+            
+            # Reverse order so the smallest child is popped first
+            children.sort(reverse=True)
+            pending.extend(children)
         
-        return sorted(keys)
+        return keys
     
     def batch_save(self, items: Dict[str, Dict[str, Any]]) -> bool:
         """Save multiple items."""
@@ -170,3 +377,37 @@ class JSONStorageBackend(StorageBackend):
         except Exception as e:
             logger.error(f"Error in batch save: {e}")
             return False
+    
+    # ==================== Async Access ====================
+    
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        """Get the dedicated IO thread pool, creating it on first use."""
+        with self._io_pool_lock:
+            if self._io_pool is None:
+                self._io_pool = ThreadPoolExecutor(
+                    max_workers=IO_POOL_WORKERS,
+                    thread_name_prefix="coordmcp-io"
+                )
+            return self._io_pool
+    
+    async def save_async(self, key: str, data: Dict[str, Any]) -> bool:
+        """
+        Save data without blocking the event loop.
+        
+        Runs save() on the backend's own thread pool rather than the loop's
+        default executor, so disk IO does not queue behind unrelated work.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_io_pool(), self.save, key, data)
+    
+    async def load_async(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load data without blocking the event loop (see save_async)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_io_pool(), self.load, key)
+    
+    def close(self) -> None:
+        """Shut down the IO thread pool, waiting for pending writes."""
+        with self._io_pool_lock:
+            pool, self._io_pool = self._io_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
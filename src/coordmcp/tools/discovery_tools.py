@@ -6,6 +6,7 @@ Provides tools for discovering projects, agents, and workspace context.
 
 from typing import Dict, Any, Optional, List
 from coordmcp.core.server import get_storage
+from coordmcp.storage.base import StorageBackend
 from coordmcp.memory.json_store import ProjectMemoryStore
 from coordmcp.context.manager import ContextManager
 from coordmcp.context.file_tracker import FileTracker
@@ -20,22 +21,26 @@ from coordmcp.logger import get_logger
 logger = get_logger("tools.discovery")
 
 
-def get_memory_store() -> ProjectMemoryStore:
+def get_memory_store(storage: Optional[StorageBackend] = None) -> ProjectMemoryStore:
     """Get or create the ProjectMemoryStore instance."""
-    storage = get_storage()
+    if storage is None:
+        storage = get_storage()
     return ProjectMemoryStore(storage)
 
 
-def get_context_manager() -> ContextManager:
+def get_context_manager(storage: Optional[StorageBackend] = None) -> ContextManager:
     """Get or create the ContextManager instance."""
-    storage = get_storage()
+    if storage is None:
+        storage = get_storage()
     file_tracker = FileTracker(storage)
     return ContextManager(storage, file_tracker)
 
 
 async def discover_project(
     path: Optional[str] = None,
-    max_parent_levels: int = 3
+    max_parent_levels: int = 3,
+    *,
+    storage: Optional[StorageBackend] = None
 ) -> Dict[str, Any]:
     """
     Discover a project by searching from a directory path.
@@ -51,6 +56,7 @@ async def discover_project(
     Args:
         path: Directory path to search from (defaults to current working directory)
         max_parent_levels: Maximum number of parent directories to search (default: 3)
+        storage: Optional storage backend (defaults to the global storage instance)
         
     Returns:
         Dictionary with discovery results:
@@ -85,7 +91,7 @@ async def discover_project(
         }
     """
     try:
-        memory_store = get_memory_store()
+        memory_store = get_memory_store(storage)
         
         found, project, message, distance = discover_project_by_path(
             memory_store=memory_store,
@@ -131,7 +137,9 @@ async def discover_project(
 async def get_project(
     project_id: Optional[str] = None,
     project_name: Optional[str] = None,
-    workspace_path: Optional[str] = None
+    workspace_path: Optional[str] = None,
+    *,
+    storage: Optional[StorageBackend] = None
 ) -> Dict[str, Any]:
     """
     Get project information by ID, name, or workspace path.
@@ -154,6 +162,7 @@ async def get_project(
         project_id: Project ID (e.g., "proj-abc-123")
         project_name: Project name (e.g., "My App")
         workspace_path: Workspace directory path (e.g., "/home/user/projects/myapp")
+        storage: Optional storage backend (defaults to the global storage instance)
         
     Returns:
         Dictionary with project details or error:
@@ -180,7 +189,7 @@ async def get_project(
         )
     """
     try:
-        memory_store = get_memory_store()
+        memory_store = get_memory_store(storage)
         
         success, project, message = resolve_project(
             memory_store=memory_store,
@@ -223,7 +232,9 @@ async def get_project(
 async def list_projects(
     status: str = "active",
     workspace_base: Optional[str] = None,
-    include_archived: bool = False
+    include_archived: bool = False,
+    *,
+    storage: Optional[StorageBackend] = None
 ) -> Dict[str, Any]:
     """
     List all CoordMCP projects with optional filtering.
@@ -240,6 +251,7 @@ async def list_projects(
         status: Filter by status - "active", "archived", or "all" (default: "active")
         workspace_base: Optional base directory to filter projects (e.g., "/home/user/projects")
         include_archived: Whether to include archived projects (default: False)
+        storage: Optional storage backend (defaults to the global storage instance)
         
     Returns:
         Dictionary with project list:
@@ -268,7 +280,7 @@ async def list_projects(
         await list_projects(workspace_base="/home/user/projects")
     """
     try:
-        memory_store = get_memory_store()
+        memory_store = get_memory_store(storage)
         
         # Get all projects
         projects = memory_store.list_projects()
@@ -323,7 +335,9 @@ async def list_projects(
 async def get_active_agents(
     project_id: Optional[str] = None,
     project_name: Optional[str] = None,
-    workspace_path: Optional[str] = None
+    workspace_path: Optional[str] = None,
+    *,
+    storage: Optional[StorageBackend] = None
 ) -> Dict[str, Any]:
     """
     Get information about active agents.
@@ -341,6 +355,7 @@ async def get_active_agents(
         project_id: Optional project ID to filter by
         project_name: Optional project name to filter by
         workspace_path: Optional workspace path to filter by
+        storage: Optional storage backend (defaults to the global storage instance)
         
     Returns:
         Dictionary with agent information:
@@ -371,8 +386,8 @@ async def get_active_agents(
         await get_active_agents(project_name="My App")
     """
     try:
-        memory_store = get_memory_store()
-        context_manager = get_context_manager()
+        memory_store = get_memory_store(storage)
+        context_manager = get_context_manager(storage)
         
         # Resolve project if filters provided
         target_project_id = None
@@ -423,7 +438,7 @@ async def get_active_agents(
                 current_project_id = agent_context.current_context.project_id
                 current_objective = agent_context.current_context.current_objective
                 # Get project name
-                project = memory_store.get_project(current_project_id)
+                project = memory_store.get_project_info(current_project_id)
                 if project:
                     current_project = project.project_name
             
@@ -5,8 +5,9 @@ Provides functions to resolve projects by ID, name, or workspace path.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List
 from coordmcp.memory.json_store import ProjectMemoryStore
 from coordmcp.memory.models import ProjectInfo
 from coordmcp.logger import get_logger
@@ -24,7 +25,22 @@ def normalize_path(path: str) -> str:
     Returns:
         Normalized absolute path
     """
-    return os.path.normpath(os.path.abspath(path))
+    if os.name == 'nt':
+        # ntpath.abspath handles drive-less rooted paths and calls
+        # GetFullPathNameW, so it is not split up like the POSIX version
+        return os.path.abspath(path)
+    path = os.fspath(path)
+    if not os.path.isabs(path):
+        # Resolved against the current directory on every call, so only
+        # the cwd-independent part below is cached
+        path = os.path.join(os.getcwd(), path)
+    return _normalize_absolute(path)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_absolute(path: str) -> str:
+    """Normalize an absolute POSIX path (what posixpath.abspath does once it has one)."""
+    return os.path.normpath(path)
 
 
 def paths_equal(path1: str, path2: str) -> bool:
@@ -45,16 +61,34 @@ def paths_equal(path1: str, path2: str) -> bool:
     if not path1 or not path2:
         return False
     
-    # Normalize both paths
-    norm1 = normalize_path(path1)
-    norm2 = normalize_path(path2)
+    return _path_key(path1) == _path_key(path2)
+
+
+def _path_key(path: str) -> str:
+    """
+    Get the form of a path used for comparisons.
     
-    # On Windows, compare case-insensitively
+    Paths are normalized, and case-folded on Windows where the filesystem
+    is case-insensitive.
+    """
+    normalized = normalize_path(path)
     if os.name == 'nt':  # Windows
-        norm1 = norm1.lower()
-        norm2 = norm2.lower()
+        return normalized.lower()
+    return normalized
+
+
+def _build_workspace_lookup(projects: List[ProjectInfo]) -> Dict[str, ProjectInfo]:
+    """
+    Map workspace path keys to projects.
     
-    return norm1 == norm2
+    When several projects share a workspace path, the first one in
+    ``projects`` wins, as with a linear scan.
+    """
+    lookup: Dict[str, ProjectInfo] = {}
+    for project in projects:
+        if project.workspace_path:
+            lookup.setdefault(_path_key(project.workspace_path), project)
+    return lookup
 
 
 def validate_workspace_path(path: str) -> Tuple[bool, str]:
@@ -185,25 +219,22 @@ def discover_project_by_path(
     
     normalized_start = normalize_path(path)
     
-    # Check if the path itself is a workspace
-    all_projects = memory_store.list_projects()
+    # One pass over the projects, then one lookup per directory level
+    workspaces = _build_workspace_lookup(memory_store.list_projects())
+    current_key = _path_key(normalized_start)
     
     for level in range(max_parent_levels + 1):
-        current_path = normalized_start
-        # Go up 'level' directories
-        for _ in range(level):
-            parent = os.path.dirname(current_path)
-            if parent == current_path:  # Reached root
-                break
-            current_path = parent
+        project = workspaces.get(current_key)
+        if project:
+            if level == 0:
+                return True, project, f"Found exact match: {project.project_name}", 0
+            else:
+                return True, project, f"Found parent project ({level} level{'s' if level > 1 else ''} up): {project.project_name}", level
         
-        # Search for project with this path
-        for project in all_projects:
-            if project.workspace_path and paths_equal(project.workspace_path, current_path):
-                if level == 0:
-                    return True, project, f"Found exact match: {project.project_name}", 0
-                else:
-                    return True, project, f"Found parent project ({level} level{'s' if level > 1 else ''} up): {project.project_name}", level
+        parent = os.path.dirname(current_key)
+        if parent == current_key:  # Reached root
+            break
+        current_key = parent
     
     return False, None, f"No project found within {max_parent_levels} parent directories of {normalized_start}", -1
 
@@ -224,7 +255,9 @@ def get_projects_by_path(
     Returns:
         List of projects within the base path
     """
-    normalized_base = normalize_path(base_path)
+    base_key = _path_key(base_path)
+    # The filesystem root already ends in a separator
+    prefix = base_key if base_key.endswith(os.sep) else base_key + os.sep
     all_projects = memory_store.list_projects()
     
     matching_projects = []
@@ -233,16 +266,15 @@ def get_projects_by_path(
         if not project.workspace_path:
             continue
         
-        normalized_project = normalize_path(project.workspace_path)
+        key = _path_key(project.workspace_path)
         
         if recursive:
-            # Check if project path starts with base path
-            if normalized_project.startswith(normalized_base + os.sep) or paths_equal(normalized_project, base_path):
+            # The base itself or anything under it
+            if key == base_key or key.startswith(prefix):
                 matching_projects.append(project)
         else:
             # Only direct children (same parent directory)
-            project_parent = os.path.dirname(normalized_project)
-            if paths_equal(project_parent, base_path):
+            if os.path.dirname(key) == base_key:
                 matching_projects.append(project)
     
     # Sort by name
@@ -266,14 +298,14 @@ def is_workspace_path_unique(
     Returns:
         True if path is unique, False otherwise
     """
-    normalized_new = normalize_path(workspace_path)
+    new_key = _path_key(workspace_path)
     all_projects = memory_store.list_projects()
     
     for project in all_projects:
         if exclude_project_id and project.project_id == exclude_project_id:
             continue
         
-        if project.workspace_path and paths_equal(project.workspace_path, workspace_path):
+        if project.workspace_path and _path_key(project.workspace_path) == new_key:
             return False
     
     return True
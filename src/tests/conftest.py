@@ -23,16 +23,27 @@ def temp_data_dir() -> Generator[Path, None, None]:
         yield Path(tmpdir)
 
 
+@pytest.fixture(scope="module")
+def _module_temp_root() -> Generator[Path, None, None]:
+    """
+    Provide a temporary root directory for one test module.
+    
+    Holds the per-test directories handed out by fresh_temp_dir and is removed
+    once, after the last test in the module, instead of once per test.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
 @pytest.fixture
-def fresh_temp_dir() -> Generator[Path, None, None]:
+def fresh_temp_dir(_module_temp_root: Path) -> Path:
     """
     Provide a fresh temporary directory for each test.
     
-    Unlike temp_data_dir, this is created fresh for each test function,
+    Unlike temp_data_dir, each test function gets its own empty directory,
     ensuring complete isolation between tests.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return Path(tempfile.mkdtemp(dir=_module_temp_root))
 
 
 @pytest.fixture(scope="session")
@@ -13,7 +13,9 @@ from coordmcp.context.file_tracker import FileTracker
 @pytest.fixture
 def storage_backend(fresh_temp_dir: Path):
     """Provide a fresh JSONStorageBackend for each test."""
-    return JSONStorageBackend(fresh_temp_dir)
+    backend = JSONStorageBackend(fresh_temp_dir)
+    yield backend
+    backend.close()
 
 
 @pytest.fixture
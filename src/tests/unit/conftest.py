@@ -4,32 +4,79 @@ Unit test fixtures for CoordMCP.
 Provides fixtures for isolated unit testing of individual components.
 """
 
+import shutil
+
 import pytest
 from pathlib import Path
 
 
+def _clear_dir(directory: Path) -> None:
+    """Remove everything inside a directory, keeping the directory itself."""
+    for child in directory.iterdir():
+        if child.is_dir():
+            shutil.rmtree(child)
+        else:
+            child.unlink()
+
+
+@pytest.fixture(scope="session")
+def _session_storage_backend(tmp_path_factory):
+    """One JSONStorageBackend (and its IO pool) shared by the whole session."""
+    from coordmcp.storage.json_adapter import JSONStorageBackend
+    backend = JSONStorageBackend(tmp_path_factory.mktemp("storage"))
+    yield backend
+    backend.close()
+
+
 @pytest.fixture
-def storage_backend(fresh_temp_dir: Path):
+def storage_backend(_session_storage_backend):
     """
-    Provide a fresh JSONStorageBackend for each test.
+    Provide the session's JSONStorageBackend, emptied after each test.
+    
+    Wiping the data directory on teardown plays the role of a transaction
+    rollback, so every test still starts from empty storage.
     
     Returns:
-        JSONStorageBackend instance with temp directory
+        JSONStorageBackend instance
     """
-    from coordmcp.storage.json_adapter import JSONStorageBackend
-    return JSONStorageBackend(fresh_temp_dir)
+    yield _session_storage_backend
+    _clear_dir(_session_storage_backend.base_dir)
+
+
+# ProjectMemoryStore, FileTracker and ContextManager keep no state of their
+# own, so they are built once over the session backend; emptying the backend
+# after each test resets them too.
+
+@pytest.fixture(scope="session")
+def _session_memory_store(_session_storage_backend):
+    """ProjectMemoryStore over the session backend."""
+    from coordmcp.memory.json_store import ProjectMemoryStore
+    return ProjectMemoryStore(_session_storage_backend)
+
+
+@pytest.fixture(scope="session")
+def _session_file_tracker(_session_storage_backend):
+    """FileTracker over the session backend."""
+    from coordmcp.context.file_tracker import FileTracker
+    return FileTracker(_session_storage_backend)
+
+
+@pytest.fixture(scope="session")
+def _session_context_manager(_session_storage_backend, _session_file_tracker):
+    """ContextManager over the session backend."""
+    from coordmcp.context.manager import ContextManager
+    return ContextManager(_session_storage_backend, _session_file_tracker)
 
 
 @pytest.fixture
-def memory_store(storage_backend):
+def memory_store(storage_backend, _session_memory_store):
     """
     Provide a ProjectMemoryStore with fresh storage.
     
     Returns:
         ProjectMemoryStore instance
     """
-    from coordmcp.memory.json_store import ProjectMemoryStore
-    return ProjectMemoryStore(storage_backend)
+    return _session_memory_store
 
 
 @pytest.fixture
@@ -61,29 +108,25 @@ def sample_workspace_dir(fresh_temp_dir):
 
 
 @pytest.fixture
-def context_manager(storage_backend):
+def context_manager(storage_backend, _session_context_manager):
     """
     Provide a ContextManager with fresh storage.
     
     Returns:
         ContextManager instance
     """
-    from coordmcp.context.manager import ContextManager
-    from coordmcp.context.file_tracker import FileTracker
-    file_tracker = FileTracker(storage_backend)
-    return ContextManager(storage_backend, file_tracker)
+    return _session_context_manager
 
 
 @pytest.fixture
-def file_tracker(storage_backend):
+def file_tracker(storage_backend, _session_file_tracker):
     """
     Provide a FileTracker with fresh storage.
     
     Returns:
         FileTracker instance
     """
-    from coordmcp.context.file_tracker import FileTracker
-    return FileTracker(storage_backend)
+    return _session_file_tracker
 
 
 @pytest.fixture
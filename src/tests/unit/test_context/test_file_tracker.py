@@ -10,7 +10,7 @@ These tests verify file locking operations including:
 
 import pytest
 from coordmcp.errors import FileLockError
-from tests.utils.assertions import assert_valid_uuid
+from tests.utils.assertions import assert_file_locked, assert_valid_uuid
 
 
 @pytest.mark.unit
@@ -358,6 +358,24 @@ class TestLockHolderQueries:
         
         assert holder is None
     
+    def test_get_lock_returns_lock_info(self, file_tracker, sample_project_id):
+        """Test that get_lock returns the lock on a locked file."""
+        file_tracker.lock_files(
+            agent_id="agent-1",
+            project_id=sample_project_id,
+            files=["src/lock_info.py"],
+            reason="Testing"
+        )
+        
+        lock_info = file_tracker.get_lock(sample_project_id, "src/lock_info.py")
+        
+        assert lock_info.reason == "Testing"
+        assert_file_locked(file_tracker, sample_project_id, "src/lock_info.py", "agent-1")
+    
+    def test_get_lock_returns_none_when_unlocked(self, file_tracker, sample_project_id):
+        """Test that get_lock returns None for unlocked file."""
+        assert file_tracker.get_lock(sample_project_id, "src/unlocked.py") is None
+    
     def test_is_locked_returns_true_when_locked(self, file_tracker, sample_project_id):
         """Test that is_locked returns True for locked file."""
         file_tracker.lock_files(
@@ -112,6 +112,23 @@ class TestAgentRegistration:
         
         profile = context_manager.get_agent(agent_id)
         assert profile is None
+    
+    def test_corrupted_profile_does_not_hide_other_agents(self, context_manager):
+        """Test that one unparseable registry entry is skipped, not the whole registry."""
+        good_id = context_manager.register_agent(
+            agent_name="Good Agent",
+            agent_type="opencode"
+        )
+        
+        key = context_manager._get_agent_registry_key()
+        data = context_manager.backend.load(key)
+        data["agents"]["broken"] = {"agent_name": "Broken"}
+        context_manager.backend.save(key, data)
+        
+        agents = context_manager.get_all_agents()
+        assert [a.agent_id for a in agents] == [good_id]
+        assert context_manager.get_agent(good_id).agent_name == "Good Agent"
+        assert context_manager.get_agent("broken") is None
 
 
 @pytest.mark.unit
@@ -92,6 +92,21 @@ class TestProjectCreation:
         
         project_info = memory_store.get_project_info(project_id)
         assert project_info.workspace_path == str(workspace)
+    
+    def test_create_projects_bulk(self, memory_store, fresh_temp_dir):
+        """Test that create_projects_bulk creates every project with empty collections."""
+        projects = [(f"Project {i}", str(fresh_temp_dir / f"project_{i}")) for i in range(3)]
+        
+        project_ids = memory_store.create_projects_bulk(projects)
+        
+        assert len(project_ids) == 3
+        for project_id, (name, workspace_path) in zip(project_ids, projects):
+            assert_valid_uuid(project_id)
+            project_info = memory_store.get_project_info(project_id)
+            assert project_info.project_name == name
+            assert project_info.workspace_path == workspace_path
+            assert memory_store.get_all_decisions(project_id) == []
+            assert memory_store.get_recent_changes(project_id) == []
 
 
 @pytest.mark.unit
@@ -492,6 +507,27 @@ class TestTaskManagement:
         assert task_id is not None
         assert_valid_uuid(task_id)
     
+    def test_create_tasks_batch(self, memory_store, sample_project_id):
+        """Test creating several tasks in one call."""
+        tasks = TaskFactory.create_batch(3, project_id=sample_project_id)
+        
+        task_ids = memory_store.create_tasks(tasks)
+        
+        assert task_ids == [t.id for t in tasks]
+        assert len(memory_store.get_project_tasks(sample_project_id)) == 3
+    
+    def test_create_tasks_unknown_project_writes_nothing(self, memory_store, sample_project_id):
+        """Test that a batch with an unknown project is rejected before any write."""
+        tasks = [
+            TaskFactory.create(project_id=sample_project_id),
+            TaskFactory.create()
+        ]
+        
+        with pytest.raises(ValueError):
+            memory_store.create_tasks(tasks)
+        
+        assert memory_store.get_project_tasks(sample_project_id) == []
+    
     def test_get_task(self, memory_store, sample_project_id):
         """Test getting a task by ID."""
         task = TaskFactory.create(project_id=sample_project_id, title="Get Me")
@@ -623,6 +659,33 @@ class TestMessaging:
         assert msg_id is not None
         assert_valid_uuid(msg_id)
     
+    def test_send_messages_batch(self, memory_store, sample_project_id):
+        """Test sending several messages in one call."""
+        agent_id = str(AgentMessageFactory.create().to_agent_id)
+        msgs = AgentMessageFactory.create_batch(
+            3,
+            project_id=sample_project_id,
+            to_agent_id=agent_id
+        )
+        
+        msg_ids = memory_store.send_messages(msgs)
+        
+        assert msg_ids == [m.id for m in msgs]
+        assert len(memory_store.get_messages(sample_project_id, agent_id)) == 3
+    
+    def test_send_messages_unknown_project_writes_nothing(self, memory_store, sample_project_id):
+        """Test that a batch with an unknown project is rejected before any write."""
+        agent_id = str(AgentMessageFactory.create().to_agent_id)
+        msgs = [
+            AgentMessageFactory.create(project_id=sample_project_id, to_agent_id=agent_id),
+            AgentMessageFactory.create(to_agent_id=agent_id)
+        ]
+        
+        with pytest.raises(ValueError):
+            memory_store.send_messages(msgs)
+        
+        assert memory_store.get_messages(sample_project_id, agent_id) == []
+    
     def test_get_messages(self, memory_store, sample_project_id):
         """Test getting messages for an agent."""
         agent_id = str(AgentMessageFactory.create().to_agent_id)
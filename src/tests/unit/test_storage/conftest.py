@@ -0,0 +1,17 @@
+"""
+Fixtures for storage backend tests.
+"""
+
+import pytest
+from pathlib import Path
+
+
+@pytest.fixture
+def fresh_temp_dir(fs) -> Path:
+    """
+    Provide an empty storage directory on an in-memory filesystem.
+    
+    Overrides the global fixture so storage tests run without real disk I/O.
+    Tests that must verify on-disk behavior use ``tmp_path`` instead.
+    """
+    return Path(fs.create_dir("/store").path)
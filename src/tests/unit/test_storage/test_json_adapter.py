@@ -9,12 +9,36 @@ Tests cover:
 """
 
 import pytest
+import asyncio
 import json
+import os
+import threading
+from datetime import datetime
+from enum import Enum
 from pathlib import Path
 
+from coordmcp.storage import json_adapter
 from coordmcp.storage.json_adapter import JSONStorageBackend
 
 
+# Static payloads shared by reference; save() never mutates its input, so
+# tests only need copy.deepcopy() if they modify the data themselves.
+_SIMPLE_DATA = {"data": "value"}
+
+_COMPLEX_DATA = {
+    "level1": {
+        "level2": {
+            "level3": ["a", "b", "c"],
+            "number": 123,
+            "boolean": True,
+            "null": None
+        }
+    },
+    "list": [1, 2, 3],
+    "datetime": "2024-01-01T00:00:00"
+}
+
+
 @pytest.mark.unit
 @pytest.mark.storage
 class TestJSONStorageBasicOperations:
@@ -24,7 +48,7 @@ class TestJSONStorageBasicOperations:
         """Test that save creates a JSON file."""
         storage = JSONStorageBackend(fresh_temp_dir)
         
-        result = storage.save("test_key", {"data": "value"})
+        result = storage.save("test_key", _SIMPLE_DATA)
         
         assert result is True
         assert (fresh_temp_dir / "test_key.json").exists()
@@ -33,7 +57,7 @@ class TestJSONStorageBasicOperations:
         """Test that save returns True on success."""
         storage = JSONStorageBackend(fresh_temp_dir)
         
-        result = storage.save("test_key", {"data": "value"})
+        result = storage.save("test_key", _SIMPLE_DATA)
         
         assert result is True
     
@@ -41,15 +65,15 @@ class TestJSONStorageBasicOperations:
         """Test that save creates nested directories for keys with slashes."""
         storage = JSONStorageBackend(fresh_temp_dir)
         
-        result = storage.save("nested/deep/key", {"data": "value"})
+        result = storage.save("nested/deep/key", _SIMPLE_DATA)
         
         assert result is True
         assert (fresh_temp_dir / "nested" / "deep" / "key.json").exists()
     
-    def test_load_returns_saved_data(self, fresh_temp_dir):
+    @pytest.mark.parametrize("data", [_SIMPLE_DATA, _COMPLEX_DATA], ids=["simple", "complex"])
+    def test_load_returns_saved_data(self, fresh_temp_dir, data):
         """Test that load returns the saved data."""
         storage = JSONStorageBackend(fresh_temp_dir)
-        data = {"name": "test", "value": 123, "nested": {"key": "value"}}
         
         storage.save("test_key", data)
         loaded = storage.load("test_key")
@@ -67,7 +91,7 @@ class TestJSONStorageBasicOperations:
     def test_delete_removes_file(self, fresh_temp_dir):
         """Test that delete removes the file."""
         storage = JSONStorageBackend(fresh_temp_dir)
-        storage.save("test_key", {"data": "value"})
+        storage.save("test_key", _SIMPLE_DATA)
         
         result = storage.delete("test_key")
         
@@ -85,7 +109,7 @@ class TestJSONStorageBasicOperations:
     def test_exists_returns_true_for_saved(self, fresh_temp_dir):
         """Test that exists returns True for saved data."""
         storage = JSONStorageBackend(fresh_temp_dir)
-        storage.save("test_key", {"data": "value"})
+        storage.save("test_key", _SIMPLE_DATA)
         
         result = storage.exists("test_key")
         
@@ -98,6 +122,16 @@ class TestJSONStorageBasicOperations:
         result = storage.exists("nonexistent")
         
         assert result is False
+    
+    def test_reads_do_not_create_directories(self, fresh_temp_dir):
+        """Test that exists/load/delete on nested keys leave the tree untouched."""
+        storage = JSONStorageBackend(fresh_temp_dir)
+        
+        assert storage.exists("missing/nested/key") is False
+        assert storage.load("missing/nested/key") is None
+        assert storage.delete("missing/nested/key") is True
+        
+        assert not (fresh_temp_dir / "missing").exists()
 
 
 @pytest.mark.unit
@@ -142,6 +176,33 @@ class TestJSONStorageListOperations:
         
         assert keys == ["a_key", "m_key", "z_key"]
     
+    def test_list_keys_includes_nested_keys(self, fresh_temp_dir):
+        """Test that list_keys walks subdirectories and skips non-JSON files."""
+        storage = JSONStorageBackend(fresh_temp_dir)
+        storage.save("top", {"data": 1})
+        storage.save("memory/proj/info", {"data": 2})
+        storage.save("memory/proj/deep/changes", {"data": 3})
+        (fresh_temp_dir / "memory" / "proj" / "stray.tmp").write_text("{}")
+        
+        assert storage.list_keys() == ["memory/proj/deep/changes", "memory/proj/info", "top"]
+        assert storage.list_keys("memory/proj/") == ["memory/proj/deep/changes", "memory/proj/info"]
+    
+    def test_list_keys_sorted_across_directories(self, fresh_temp_dir):
+        """Test that keys from sibling files and directories come out in string order."""
+        storage = JSONStorageBackend(fresh_temp_dir)
+        names = ["a", "a-b", "a/x", "a/x-y/z", "a/x/y", "a_b", "ab", "a/0", "b/a", "B"]
+        for name in reversed(names):
+            storage.save(name, _SIMPLE_DATA)
+        
+        assert storage.list_keys() == sorted(names)
+        assert storage.list_keys("a") == sorted(n for n in names if n.startswith("a/"))
+    
+    def test_list_keys_missing_prefix_returns_empty(self, fresh_temp_dir):
+        """Test list_keys with a prefix that has no directory."""
+        storage = JSONStorageBackend(fresh_temp_dir)
+        
+        assert storage.list_keys("nothing_here") == []
+    
     def test_list_keys_empty_storage(self, fresh_temp_dir):
         """Test list_keys on empty storage."""
         storage = JSONStorageBackend(fresh_temp_dir)
@@ -177,35 +238,49 @@ class TestJSONStorageSecurity:
         storage = JSONStorageBackend(fresh_temp_dir)
         
         with pytest.raises(ValueError, match="path traversal"):
-            storage.save("../outside", {"data": "value"})
+            storage.save("../outside", _SIMPLE_DATA)
     
     def test_path_traversal_absolute_rejected(self, fresh_temp_dir):
         """Test that absolute paths are rejected."""
         storage = JSONStorageBackend(fresh_temp_dir)
         
         with pytest.raises(ValueError, match="path traversal"):
-            storage.save("/etc/passwd", {"data": "value"})
+            storage.save("/etc/passwd", _SIMPLE_DATA)
     
     def test_path_traversal_backslash_rejected(self, fresh_temp_dir):
         """Test that backslash absolute paths are rejected."""
         storage = JSONStorageBackend(fresh_temp_dir)
         
         with pytest.raises(ValueError, match="path traversal"):
-            storage.save("\\\\server\\share", {"data": "value"})
+            storage.save("\\\\server\\share", _SIMPLE_DATA)
     
     def test_invalid_key_special_chars_rejected(self, fresh_temp_dir):
         """Test that invalid characters in keys are rejected."""
         storage = JSONStorageBackend(fresh_temp_dir)
         
         with pytest.raises(ValueError, match="Invalid key"):
-            storage.save("key with spaces", {"data": "value"})
+            storage.save("key with spaces", _SIMPLE_DATA)
+    
+    def test_invalid_key_trailing_newline_rejected(self, fresh_temp_dir):
+        """Test that a trailing newline does not slip through validation."""
+        storage = JSONStorageBackend(fresh_temp_dir)
+        
+        with pytest.raises(ValueError, match="Invalid key"):
+            storage.save("key\n", _SIMPLE_DATA)
+    
+    def test_unicode_word_characters_allowed(self, fresh_temp_dir):
+        """Test that non-ASCII letters are accepted like other word characters."""
+        storage = JSONStorageBackend(fresh_temp_dir)
+        
+        assert storage.save("projets/café_1", _SIMPLE_DATA) is True
+        assert storage.load("projets/café_1") == _SIMPLE_DATA
     
     def test_invalid_key_dots_rejected(self, fresh_temp_dir):
         """Test that . and .. in key paths are rejected."""
         storage = JSONStorageBackend(fresh_temp_dir)
         
         with pytest.raises(ValueError):
-            storage.save("path/./key", {"data": "value"})
+            storage.save("path/./key", _SIMPLE_DATA)
 
 
 @pytest.mark.unit
@@ -217,7 +292,7 @@ class TestJSONStorageValidation:
         """Test that empty key is rejected."""
         storage = JSONStorageBackend(fresh_temp_dir)
         
-        result = storage.save("", {"data": "value"})
+        result = storage.save("", _SIMPLE_DATA)
         
         assert result is False
     
@@ -225,7 +300,7 @@ class TestJSONStorageValidation:
         """Test that None key is rejected."""
         storage = JSONStorageBackend(fresh_temp_dir)
         
-        result = storage.save(None, {"data": "value"})
+        result = storage.save(None, _SIMPLE_DATA)
         
         assert result is False
     
@@ -264,23 +339,11 @@ class TestJSONStorageEdgeCases:
     def test_save_complex_nested_data(self, fresh_temp_dir):
         """Test saving complex nested data structures."""
         storage = JSONStorageBackend(fresh_temp_dir)
-        complex_data = {
-            "level1": {
-                "level2": {
-                    "level3": ["a", "b", "c"],
-                    "number": 123,
-                    "boolean": True,
-                    "null": None
-                }
-            },
-            "list": [1, 2, 3],
-            "datetime": "2024-01-01T00:00:00"
-        }
         
-        storage.save("complex", complex_data)
+        storage.save("complex", _COMPLEX_DATA)
         loaded = storage.load("complex")
         
-        assert loaded == complex_data
+        assert loaded == _COMPLEX_DATA
     
     def test_load_corrupted_json_returns_none(self, fresh_temp_dir):
         """Test that corrupted JSON returns None."""
@@ -293,25 +356,278 @@ class TestJSONStorageEdgeCases:
         result = storage.load("corrupted")
         
         assert result is None
+
+    def test_load_invalid_utf8_returns_none(self, fresh_temp_dir):
+        """Test that undecodable bytes are treated as corrupted data."""
+        storage = JSONStorageBackend(fresh_temp_dir)
+        
+        (fresh_temp_dir / "binary.json").write_bytes(b"\xff\xfe{\x00")
+        
+        assert storage.load("binary") is None
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@pytest.mark.unit
+@pytest.mark.storage
+class TestJSONStorageEncoding:
+    """Test that the optional orjson path and the stdlib path agree."""
+    
+    DATA = {
+        "id": "abc",
+        "created_at": datetime(2024, 1, 1, 12, 30, 15, 123456),
+        "tags": ["a", "b"],
+        "nested": {"empty_list": [], "empty_dict": {}, "number": 1.5, "flag": None},
+        1: "int key",
+    }
+    
+    def test_encoding_matches_stdlib_json(self):
+        """Test that encoded bytes match json.dumps(indent=2, default=str)."""
+        expected = json.dumps(self.DATA, indent=2, default=str).encode("utf-8")
+        
+        assert json_adapter._encode(self.DATA) == expected
+    
+    @pytest.mark.parametrize("data", [
+        {"text": "caf\u00e9 \u2028 \u65e5\u672c"},
+        {"status": Color.RED},
+    ], ids=["non-ascii", "plain-enum"])
+    def test_encoders_agree(self, data, monkeypatch):
+        """Test that the orjson and stdlib paths write the same bytes."""
+        encoded = json_adapter._encode(data)
+        monkeypatch.setattr(json_adapter, "orjson", None)
+        
+        assert json_adapter._encode(data) == encoded
+    
+    def test_non_ascii_round_trip(self, fresh_temp_dir):
+        """Test that non-ASCII text is saved as UTF-8 and loads unchanged."""
+        storage = JSONStorageBackend(fresh_temp_dir)
+        data = {"text": "caf\u00e9 \u2028 \u65e5\u672c"}
+        
+        storage.save("text", data)
+        
+        assert "caf\u00e9" in (fresh_temp_dir / "text.json").read_text(encoding="utf-8")
+        assert storage.load("text") == data
+    
+    def test_non_finite_floats_round_trip(self, fresh_temp_dir):
+        """Test that NaN and infinity are saved as values, not null."""
+        storage = JSONStorageBackend(fresh_temp_dir)
+        
+        storage.save("floats", {"scores": [float("nan"), float("inf"), -float("inf")]})
+        nan, inf, neg_inf = storage.load("floats")["scores"]
+        
+        assert nan != nan
+        assert inf == float("inf")
+        assert neg_inf == -float("inf")
+    
+    def test_round_trip_without_orjson(self, fresh_temp_dir, monkeypatch):
+        """Test that storage works when orjson is not installed."""
+        monkeypatch.setattr(json_adapter, "orjson", None)
+        storage = JSONStorageBackend(fresh_temp_dir)
+        
+        storage.save("test_key", {"data": "value", "when": datetime(2024, 1, 1)})
+        
+        assert storage.load("test_key") == {"data": "value", "when": "2024-01-01 00:00:00"}
     
-    def test_base_dir_created_if_not_exists(self, fresh_temp_dir):
+    def test_huge_integers_fall_back_to_stdlib(self, fresh_temp_dir):
+        """Test that values orjson cannot encode are still saved."""
+        storage = JSONStorageBackend(fresh_temp_dir)
+        
+        assert storage.save("big", {"n": 2 ** 70}) is True
+        assert storage.load("big") == {"n": 2 ** 70}
+    
+    def test_nan_written_by_stdlib_still_loads(self, fresh_temp_dir):
+        """Test that files containing NaN, which strict parsers reject, load."""
+        storage = JSONStorageBackend(fresh_temp_dir)
+        (fresh_temp_dir / "nan.json").write_text('{"value": NaN}')
+        
+        loaded = storage.load("nan")
+        
+        assert loaded["value"] != loaded["value"]
+
+
+@pytest.mark.unit
+@pytest.mark.storage
+@pytest.mark.skipif(json_adapter.zstandard is None, reason="zstandard not installed")
+class TestJSONStorageCompression:
+    """Test zstd compression of large payloads."""
+    
+    LARGE_DATA = {"items": [{"id": i, "name": f"item-{i}"} for i in range(500)]}
+    
+    def test_large_data_is_compressed_on_disk(self, fresh_temp_dir):
+        """Test that payloads above the threshold are stored as a zstd frame."""
+        storage = JSONStorageBackend(fresh_temp_dir, compression=True)
+        uncompressed_size = len(json_adapter._encode(self.LARGE_DATA))
+        
+        storage.save("large", self.LARGE_DATA)
+        raw = (fresh_temp_dir / "large.json").read_bytes()
+        
+        assert raw.startswith(json_adapter._ZSTD_MAGIC)
+        assert len(raw) < uncompressed_size
+        assert storage.load("large") == self.LARGE_DATA
+    
+    def test_small_data_stays_plain_json(self, fresh_temp_dir):
+        """Test that payloads below the threshold are not compressed."""
+        storage = JSONStorageBackend(fresh_temp_dir, compression=True)
+        
+        storage.save("small", _SIMPLE_DATA)
+        
+        assert json.loads((fresh_temp_dir / "small.json").read_text()) == _SIMPLE_DATA
+    
+    def test_backwards_compat_uncompressed_files_still_load(self, fresh_temp_dir):
+        """Test that plain files written without compression load with it enabled."""
+        JSONStorageBackend(fresh_temp_dir).save("large", self.LARGE_DATA)
+        
+        storage = JSONStorageBackend(fresh_temp_dir, compression=True)
+        
+        assert storage.load("large") == self.LARGE_DATA
+    
+    def test_compressed_files_load_with_compression_disabled(self, fresh_temp_dir):
+        """Test that turning compression off keeps existing compressed files readable."""
+        JSONStorageBackend(fresh_temp_dir, compression=True).save("large", self.LARGE_DATA)
+        
+        storage = JSONStorageBackend(fresh_temp_dir)
+        
+        assert storage.load("large") == self.LARGE_DATA
+    
+    def test_compression_disabled_without_zstandard(self, fresh_temp_dir, monkeypatch):
+        """Test that requesting compression without zstandard stores plain JSON."""
+        monkeypatch.setattr(json_adapter, "zstandard", None)
+        storage = JSONStorageBackend(fresh_temp_dir, compression=True)
+        
+        storage.save("large", self.LARGE_DATA)
+        
+        assert storage.compression is False
+        assert storage.load("large") == self.LARGE_DATA
+
+
+@pytest.mark.unit
+@pytest.mark.storage
+class TestJSONStorageAsync:
+    """Test async access through the dedicated IO pool."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_all_persist(self, tmp_path):
+        """Test that many concurrent async saves all land on disk."""
+        storage = JSONStorageBackend(tmp_path)
+        try:
+            results = await asyncio.gather(
+                *(storage.save_async(f"batch/key{i}", {"n": i}) for i in range(100))
+            )
+            
+            assert all(results)
+            assert len(storage.list_keys("batch")) == 100
+            assert await storage.load_async("batch/key42") == {"n": 42}
+        finally:
+            storage.close()
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_to_same_key(self, tmp_path):
+        """Test that concurrent async saves of one key all succeed and leave a valid file."""
+        storage = JSONStorageBackend(tmp_path)
+        payloads = [{"writer": i, "items": list(range(500))} for i in range(8)]
+        try:
+            for _ in range(20):
+                results = await asyncio.gather(
+                    *(storage.save_async("shared", data) for data in payloads)
+                )
+                
+                assert all(results)
+                assert await storage.load_async("shared") in payloads
+            assert list(tmp_path.glob("*.tmp")) == []
+        finally:
+            storage.close()
+    
+    @pytest.mark.asyncio
+    async def test_async_io_runs_on_dedicated_pool(self, tmp_path, monkeypatch):
+        """Test that async calls run on coordmcp-io threads, not the default executor."""
+        storage = JSONStorageBackend(tmp_path)
+        thread_names = []
+        real_save = storage.save
+        
+        def _recording_save(key, data):
+            thread_names.append(threading.current_thread().name)
+            return real_save(key, data)
+        
+        monkeypatch.setattr(storage, "save", _recording_save)
+        try:
+            await storage.save_async("test_key", _SIMPLE_DATA)
+        finally:
+            storage.close()
+        
+        assert thread_names[0].startswith("coordmcp-io")
+    
+    def test_pool_not_created_until_needed(self, tmp_path):
+        """Test that sync-only use never starts IO threads."""
+        storage = JSONStorageBackend(tmp_path)
+        storage.save("test_key", _SIMPLE_DATA)
+        
+        assert storage._io_pool is None
+        storage.close()
+    
+    @pytest.mark.asyncio
+    async def test_close_allows_reuse(self, tmp_path):
+        """Test that a closed backend starts a new pool on the next async call."""
+        storage = JSONStorageBackend(tmp_path)
+        await storage.save_async("first", {"n": 1})
+        storage.close()
+        
+        assert await storage.load_async("first") == {"n": 1}
+        storage.close()
+
+
+@pytest.mark.unit
+@pytest.mark.storage
+class TestJSONStorageOnDisk:
+    """Test behavior that depends on the real filesystem."""
+    
+    def test_base_dir_created_if_not_exists(self, tmp_path):
         """Test that base_dir is created if it doesn't exist."""
-        new_dir = fresh_temp_dir / "new_storage"
+        new_dir = tmp_path / "new_storage"
         
         storage = JSONStorageBackend(new_dir)
         
         assert new_dir.exists()
     
-    def test_atomic_write_uses_temp_file(self, fresh_temp_dir):
+    def test_atomic_write_uses_temp_file(self, tmp_path):
         """Test that writes use temp file then rename."""
-        storage = JSONStorageBackend(fresh_temp_dir)
+        storage = JSONStorageBackend(tmp_path)
         
-        storage.save("test_key", {"data": "value"})
+        storage.save("test_key", _SIMPLE_DATA)
         
-        # Temp file should not exist after save
-        assert not (fresh_temp_dir / "test_key.tmp").exists()
+        # No temp file should be left after save
+        assert list(tmp_path.glob("*.tmp")) == []
         # Final file should exist
-        assert (fresh_temp_dir / "test_key.json").exists()
+        assert (tmp_path / "test_key.json").exists()
+    
+    def test_default_durability_skips_fsync(self, tmp_path, monkeypatch):
+        """Test that the default mode does not fsync on save."""
+        calls = []
+        monkeypatch.setattr(os, "fsync", lambda fd: calls.append(fd))
+        storage = JSONStorageBackend(tmp_path)
+        
+        storage.save("test_key", _SIMPLE_DATA)
+        
+        assert storage.durability == "none"
+        assert calls == []
+    
+    def test_sync_durability_fsyncs_file_and_directory(self, tmp_path, monkeypatch):
+        """Test that sync mode flushes the file and, on POSIX, its directory."""
+        calls = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: calls.append(fd) or real_fsync(fd))
+        storage = JSONStorageBackend(tmp_path, durability="sync")
+        
+        assert storage.save("nested/key", _SIMPLE_DATA) is True
+        
+        assert len(calls) == (1 if os.name == "nt" else 2)
+        assert storage.load("nested/key") == _SIMPLE_DATA
+    
+    def test_invalid_durability_rejected(self, tmp_path):
+        """Test that unknown durability modes are rejected."""
+        with pytest.raises(ValueError, match="Invalid durability mode"):
+            JSONStorageBackend(tmp_path, durability="sometimes")
 
 
 if __name__ == "__main__":
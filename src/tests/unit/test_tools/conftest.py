@@ -5,43 +5,72 @@ Fixtures for MCP tools tests.
 import pytest
 from pathlib import Path
 from unittest.mock import patch
-from coordmcp.storage.json_adapter import JSONStorageBackend
-from coordmcp.memory.json_store import ProjectMemoryStore
-from coordmcp.context.manager import ContextManager
-from coordmcp.context.file_tracker import FileTracker
 
 
-@pytest.fixture
-def storage_backend(fresh_temp_dir: Path):
-    """Provide a fresh JSONStorageBackend for each test."""
-    return JSONStorageBackend(fresh_temp_dir)
-
-
-@pytest.fixture
-def memory_store(storage_backend):
-    """Provide a ProjectMemoryStore with fresh storage."""
-    return ProjectMemoryStore(storage_backend)
+@pytest.fixture(scope="module")
+def shared_workspace(tmp_path_factory) -> Path:
+    """
+    Provide a workspace root created once per test module.
+    
+    Tools only record workspace paths; no test writes into them, so workspace
+    directories can be reused across tests instead of recreated each time.
+    """
+    return tmp_path_factory.mktemp("workspace")
 
 
 @pytest.fixture
-def sample_project_id(memory_store, fresh_temp_dir):
-    """Create and return a sample project ID."""
-    workspace = fresh_temp_dir / "test_project"
-    workspace.mkdir(exist_ok=True)
-    return memory_store.create_project(
+def sample_project(memory_store, shared_workspace):
+    """
+    Create a sample project and return ``(project_id, workspace)``.
+    
+    Function-scoped because storage is emptied after every test; tests that
+    only read the project share this one setup instead of repeating it.
+    """
+    # create_project only records the path, so the directory is never created
+    workspace = shared_workspace / "test_project"
+    project_id = memory_store.create_project(
         project_name="Test Project",
         description="Test project for unit tests",
         workspace_path=str(workspace)
     )
+    return project_id, workspace
+
+
+@pytest.fixture
+def sample_project_id(sample_project):
+    """Create and return a sample project ID."""
+    return sample_project[0]
+
+
+@pytest.fixture
+def sample_agent_id(context_manager):
+    """Register a sample agent and return its ID."""
+    return context_manager.register_agent("TestAgent", "opencode")
 
 
 @pytest.fixture
-def file_tracker(storage_backend):
-    """Provide a FileTracker with fresh storage."""
-    return FileTracker(storage_backend)
+def bind_tool_stores(monkeypatch, memory_store, context_manager):
+    """
+    Return a function that points a tools module at the test stores.
+    
+    Call it with the module under test, e.g. ``bind_tool_stores(task_tools)``.
+    """
+    def _bind(tools_module):
+        monkeypatch.setattr(tools_module, "get_memory_store", lambda: memory_store)
+        monkeypatch.setattr(tools_module, "get_context_manager", lambda: context_manager)
+    return _bind
 
 
 @pytest.fixture
-def context_manager(storage_backend, file_tracker):
-    """Provide a ContextManager with fresh storage."""
-    return ContextManager(storage_backend, file_tracker)
+def stub_project_resolver(monkeypatch, sample_project_id):
+    """
+    Return a function that makes a tools module resolve every project to the sample project.
+    
+    Only for tests that do not exercise project resolution themselves.
+    """
+    def _stub(tools_module):
+        monkeypatch.setattr(
+            tools_module, "resolve_project_id",
+            lambda *args, **kwargs: (True, sample_project_id, "OK")
+        )
+    return _stub
@@ -2,15 +2,29 @@
 Unit tests for messaging tools.
 
 Tests agent messaging functionality including sending, receiving, and broadcast messages.
-Note: Tests mock the fastmcp dependencies due to environment constraints.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+
+from coordmcp.tools import message_tools
+from tests.utils.factories import AgentMessageFactory
+
+
+@pytest.fixture(autouse=True)
+def _bind_stores(bind_tool_stores):
+    """Point the message tools at the test stores for every test."""
+    bind_tool_stores(message_tools)
+
+
+@pytest.fixture
+def resolve_to_sample_project(stub_project_resolver):
+    """Resolve every project to the sample project instead of looking it up."""
+    stub_project_resolver(message_tools)
 
 
 @pytest.mark.unit
 @pytest.mark.tools
+@pytest.mark.xdist_group(name="send-message")
 
 class TestSendMessage:
     """Test message sending."""
@@ -18,131 +32,104 @@ class TestSendMessage:
     @pytest.mark.asyncio
     async def test_send_message_success(self, memory_store, context_manager, sample_project_id):
         """Test successful message sending."""
-        from coordmcp.tools import message_tools
-        
         # Create sender and recipient
         sender_id = context_manager.register_agent("Sender", "opencode")
         recipient_id = context_manager.register_agent("Recipient", "cursor")
         
-        with patch.object(message_tools, 'get_memory_store', return_value=memory_store), \
-             patch.object(message_tools, 'get_context_manager', return_value=context_manager):
-            
-            result = await message_tools.send_message(
-                from_agent_id=sender_id,
-                to_agent_id=recipient_id,
-                project_id=sample_project_id,
-                content="Hello from sender!"
-            )
-            
-            assert result["success"] is True
-            assert "message_id" in result
+        result = await message_tools.send_message(
+            from_agent_id=sender_id,
+            to_agent_id=recipient_id,
+            project_id=sample_project_id,
+            content="Hello from sender!"
+        )
+        
+        assert result["success"] is True
+        assert "message_id" in result
     
     @pytest.mark.asyncio
     async def test_send_message_broadcast(self, memory_store, context_manager, sample_project_id):
         """Test broadcast message to all agents."""
-        from coordmcp.tools import message_tools
-        
         sender_id = context_manager.register_agent("Broadcaster", "opencode")
         
-        with patch.object(message_tools, 'get_memory_store', return_value=memory_store), \
-             patch.object(message_tools, 'get_context_manager', return_value=context_manager):
-            
-            result = await message_tools.send_message(
-                from_agent_id=sender_id,
-                to_agent_id="broadcast",
-                project_id=sample_project_id,
-                content="Broadcast message!",
-                message_type="alert"
-            )
-            
-            assert result["success"] is True
-            assert "all agents" in result["message"].lower()
+        result = await message_tools.send_message(
+            from_agent_id=sender_id,
+            to_agent_id="broadcast",
+            project_id=sample_project_id,
+            content="Broadcast message!",
+            message_type="alert"
+        )
+        
+        assert result["success"] is True
+        assert "all agents" in result["message"].lower()
     
     @pytest.mark.asyncio
     async def test_send_message_invalid_recipient(self, memory_store, context_manager, sample_project_id):
         """Test that sending to nonexistent recipient fails."""
-        from coordmcp.tools import message_tools
-        
         sender_id = context_manager.register_agent("Sender", "opencode")
         
-        with patch.object(message_tools, 'get_memory_store', return_value=memory_store), \
-             patch.object(message_tools, 'get_context_manager', return_value=context_manager):
-            
-            result = await message_tools.send_message(
-                from_agent_id=sender_id,
-                to_agent_id="nonexistent-agent",
-                project_id=sample_project_id,
-                content="Hello"
-            )
-            
-            assert result["success"] is False
-            assert "not found" in result["error"].lower()
+        result = await message_tools.send_message(
+            from_agent_id=sender_id,
+            to_agent_id="nonexistent-agent",
+            project_id=sample_project_id,
+            content="Hello"
+        )
+        
+        assert result["success"] is False
+        assert "not found" in result["error"].lower()
     
     @pytest.mark.asyncio
     async def test_send_message_invalid_type_defaults(self, memory_store, context_manager, sample_project_id):
         """Test that invalid message type defaults to update."""
-        from coordmcp.tools import message_tools
-        
         sender_id = context_manager.register_agent("Sender", "opencode")
         recipient_id = context_manager.register_agent("Recipient", "cursor")
         
-        with patch.object(message_tools, 'get_memory_store', return_value=memory_store), \
-             patch.object(message_tools, 'get_context_manager', return_value=context_manager):
-            
-            result = await message_tools.send_message(
-                from_agent_id=sender_id,
-                to_agent_id=recipient_id,
-                project_id=sample_project_id,
-                content="Test",
-                message_type="invalid_type"
-            )
-            
-            # Should succeed with default type
-            assert result["success"] is True
+        result = await message_tools.send_message(
+            from_agent_id=sender_id,
+            to_agent_id=recipient_id,
+            project_id=sample_project_id,
+            content="Test",
+            message_type="invalid_type"
+        )
+        
+        # Should succeed with default type
+        assert result["success"] is True
 
 
 @pytest.mark.unit
 @pytest.mark.tools
+@pytest.mark.xdist_group(name="get-messages")
 
 class TestGetMessages:
     """Test message retrieval."""
     
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("resolve_to_sample_project")
     async def test_get_messages_for_agent(self, memory_store, context_manager, sample_project_id):
         """Test getting messages for an agent."""
-        from coordmcp.tools import message_tools
-        from tests.utils.factories import AgentMessageFactory
-        
         # Create agents
         sender_id = context_manager.register_agent("Sender", "opencode")
         recipient_id = context_manager.register_agent("Recipient", "cursor")
         
         # Create messages
-        for i in range(3):
-            msg = AgentMessageFactory.create(
-                from_agent_id=sender_id,
-                to_agent_id=recipient_id,
-                project_id=sample_project_id
-            )
-            memory_store.send_message(msg)
+        memory_store.send_messages(AgentMessageFactory.create_batch(
+            3,
+            from_agent_id=sender_id,
+            to_agent_id=recipient_id,
+            project_id=sample_project_id
+        ))
+        
+        result = await message_tools.get_messages(
+            agent_id=recipient_id,
+            project_id=sample_project_id
+        )
         
-        with patch.object(message_tools, 'get_memory_store', return_value=memory_store), \
-             patch.object(message_tools, 'resolve_project_id', return_value=(True, sample_project_id, "OK")):
-            
-            result = await message_tools.get_messages(
-                agent_id=recipient_id,
-                project_id=sample_project_id
-            )
-            
-            assert result["success"] is True
-            assert result["count"] == 3
+        assert result["success"] is True
+        assert result["count"] == 3
     
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("resolve_to_sample_project")
     async def test_get_unread_messages_only(self, memory_store, context_manager, sample_project_id):
         """Test filtering to unread messages only."""
-        from coordmcp.tools import message_tools
-        from tests.utils.factories import AgentMessageFactory
-        
         sender_id = context_manager.register_agent("Sender", "opencode")
         recipient_id = context_manager.register_agent("Recipient", "cursor")
         
@@ -152,41 +139,35 @@ class TestGetMessages:
             to_agent_id=recipient_id,
             project_id=sample_project_id
         )
-        memory_store.send_message(msg1)
-        
         msg2 = AgentMessageFactory.create(
             from_agent_id=sender_id,
             to_agent_id=recipient_id,
             project_id=sample_project_id,
             read=True
         )
-        memory_store.send_message(msg2)
+        memory_store.send_messages([msg1, msg2])
         
-        with patch.object(message_tools, 'get_memory_store', return_value=memory_store), \
-             patch.object(message_tools, 'resolve_project_id', return_value=(True, sample_project_id, "OK")):
-            
-            result = await message_tools.get_messages(
-                agent_id=recipient_id,
-                project_id=sample_project_id,
-                unread_only=True
-            )
-            
-            assert result["success"] is True
-            assert result["count"] == 1
+        result = await message_tools.get_messages(
+            agent_id=recipient_id,
+            project_id=sample_project_id,
+            unread_only=True
+        )
+        
+        assert result["success"] is True
+        assert result["count"] == 1
 
 
 @pytest.mark.unit
 @pytest.mark.tools
+@pytest.mark.xdist_group(name="mark-message-read")
 
 class TestMarkMessageRead:
     """Test marking messages as read."""
     
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("resolve_to_sample_project")
     async def test_mark_message_read_success(self, memory_store, context_manager, sample_project_id):
         """Test successfully marking a message as read."""
-        from coordmcp.tools import message_tools
-        from tests.utils.factories import AgentMessageFactory
-        
         sender_id = context_manager.register_agent("Sender", "opencode")
         recipient_id = context_manager.register_agent("Recipient", "cursor")
         
@@ -197,23 +178,18 @@ class TestMarkMessageRead:
         )
         msg_id = memory_store.send_message(msg)
         
-        with patch.object(message_tools, 'get_memory_store', return_value=memory_store), \
-             patch.object(message_tools, 'resolve_project_id', return_value=(True, sample_project_id, "OK")):
-            
-            result = await message_tools.mark_message_read(
-                agent_id=recipient_id,
-                message_id=msg_id,
-                project_id=sample_project_id
-            )
-            
-            assert result["success"] is True
+        result = await message_tools.mark_message_read(
+            agent_id=recipient_id,
+            message_id=msg_id,
+            project_id=sample_project_id
+        )
+        
+        assert result["success"] is True
     
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("resolve_to_sample_project")
     async def test_mark_message_read_wrong_recipient(self, memory_store, sample_project_id):
         """Test that marking read fails for wrong recipient."""
-        from coordmcp.tools import message_tools
-        from tests.utils.factories import AgentMessageFactory
-        
         msg = AgentMessageFactory.create(
             from_agent_id="sender",
             to_agent_id="intended-recipient",
@@ -221,20 +197,18 @@ class TestMarkMessageRead:
         )
         msg_id = memory_store.send_message(msg)
         
-        with patch.object(message_tools, 'get_memory_store', return_value=memory_store), \
-             patch.object(message_tools, 'resolve_project_id', return_value=(True, sample_project_id, "OK")):
-            
-            result = await message_tools.mark_message_read(
-                agent_id="wrong-recipient",
-                message_id=msg_id,
-                project_id=sample_project_id
-            )
-            
-            assert result["success"] is False
+        result = await message_tools.mark_message_read(
+            agent_id="wrong-recipient",
+            message_id=msg_id,
+            project_id=sample_project_id
+        )
+        
+        assert result["success"] is False
 
 
 @pytest.mark.unit
 @pytest.mark.tools
+@pytest.mark.xdist_group(name="broadcast-message")
 
 class TestBroadcastMessage:
     """Test broadcast messaging."""
@@ -242,57 +216,47 @@ class TestBroadcastMessage:
     @pytest.mark.asyncio
     async def test_broadcast_message(self, memory_store, context_manager, sample_project_id):
         """Test broadcasting a message to all agents."""
-        from coordmcp.tools import message_tools
-        
         sender_id = context_manager.register_agent("Broadcaster", "opencode")
         
-        with patch.object(message_tools, 'get_memory_store', return_value=memory_store), \
-             patch.object(message_tools, 'get_context_manager', return_value=context_manager):
-            
-            result = await message_tools.broadcast_message(
-                from_agent_id=sender_id,
-                project_id=sample_project_id,
-                content="Attention all agents!",
-                message_type="alert"
-            )
-            
-            assert result["success"] is True
+        result = await message_tools.broadcast_message(
+            from_agent_id=sender_id,
+            project_id=sample_project_id,
+            content="Attention all agents!",
+            message_type="alert"
+        )
+        
+        assert result["success"] is True
 
 
 @pytest.mark.unit
 @pytest.mark.tools
+@pytest.mark.xdist_group(name="get-sent-messages")
 
 class TestGetSentMessages:
     """Test getting sent messages."""
     
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("resolve_to_sample_project")
     async def test_get_sent_messages(self, memory_store, context_manager, sample_project_id):
         """Test getting messages sent by an agent."""
-        from coordmcp.tools import message_tools
-        from tests.utils.factories import AgentMessageFactory
-        
         sender_id = context_manager.register_agent("Sender", "opencode")
         recipient_id = context_manager.register_agent("Recipient", "cursor")
         
         # Send some messages
-        for i in range(2):
-            msg = AgentMessageFactory.create(
-                from_agent_id=sender_id,
-                to_agent_id=recipient_id,
-                project_id=sample_project_id
-            )
-            memory_store.send_message(msg)
+        memory_store.send_messages(AgentMessageFactory.create_batch(
+            2,
+            from_agent_id=sender_id,
+            to_agent_id=recipient_id,
+            project_id=sample_project_id
+        ))
+        
+        result = await message_tools.get_sent_messages(
+            agent_id=sender_id,
+            project_id=sample_project_id
+        )
         
-        with patch.object(message_tools, 'get_memory_store', return_value=memory_store), \
-             patch.object(message_tools, 'resolve_project_id', return_value=(True, sample_project_id, "OK")):
-            
-            result = await message_tools.get_sent_messages(
-                agent_id=sender_id,
-                project_id=sample_project_id
-            )
-            
-            assert result["success"] is True
-            assert result["count"] == 2
+        assert result["success"] is True
+        assert result["count"] == 2
 
 
 if __name__ == "__main__":
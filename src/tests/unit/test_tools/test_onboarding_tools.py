@@ -7,254 +7,174 @@ Tests the project onboarding functionality including:
 - Building project info, agent context, active agents, recent changes
 """
 
+import itertools
+
 import pytest
-from pathlib import Path
-from datetime import datetime
-from unittest.mock import patch, MagicMock
+import pytest_asyncio
 
-from coordmcp.context.state import AgentProfile, ProjectActivity, AgentType
-from coordmcp.context.manager import ContextManager
-from coordmcp.context.file_tracker import FileTracker
-from coordmcp.memory.models import ProjectInfo
+from coordmcp.memory.models import ChangeType
+from coordmcp.tools import onboarding_tools
+from tests.utils.factories import ChangeFactory
 
+# The onboarding paths are free of deprecated calls; keep them that way.
+# (Not set suite-wide: file tracking still goes through pydantic's .dict().)
+pytestmark = pytest.mark.filterwarnings("error::DeprecationWarning")
 
-@pytest.mark.unit
-@pytest.mark.onboarding
-class TestGetProjectOnboardingContext:
-    """Test getting project onboarding context."""
+_ids = itertools.count()
 
-    @pytest.fixture
-    def setup_project(self, memory_store, fresh_temp_dir):
-        """Helper to create a test project."""
-        def _create(name, workspace_name):
-            workspace = fresh_temp_dir / workspace_name
-            workspace.mkdir()
-            project_id = memory_store.create_project(
-                project_name=name,
-                workspace_path=str(workspace)
-            )
-            return project_id, workspace
-        return _create
 
-    @pytest.fixture
-    def mock_storage(self, storage_backend):
-        """Mock get_storage to return test storage."""
-        return storage_backend
+def _fake_id():
+    """Return a cheap, deterministic id for test records."""
+    return f"chg_{next(_ids)}"
 
-    @pytest.mark.asyncio
-    async def test_onboarding_success_new_agent(self, memory_store, context_manager, fresh_temp_dir):
-        """Test onboarding context for a new agent in a project."""
-        from coordmcp.tools import onboarding_tools
 
-        workspace = fresh_temp_dir / "test_workspace"
-        workspace.mkdir()
-        project_id = memory_store.create_project(
-            project_name="Test Project",
-            workspace_path=str(workspace)
-        )
+@pytest.fixture(autouse=True)
+def _patch_onboarding_deps(monkeypatch, context_manager, memory_store):
+    """
+    Point the onboarding tools at the test stores for every test.
 
-        agent_id = context_manager.register_agent("TestAgent", "opencode")
+    Being autouse, this also sets up both stores, so tests only request
+    memory_store or context_manager when they use them directly.
+    """
+    monkeypatch.setattr(onboarding_tools, "get_context_manager", lambda: context_manager)
+    monkeypatch.setattr(onboarding_tools, "get_memory_store", lambda: memory_store)
 
-        with patch.object(onboarding_tools, 'get_context_manager', return_value=context_manager), \
-             patch.object(onboarding_tools, 'get_memory_store', return_value=memory_store):
-            result = await onboarding_tools.get_project_onboarding_context(
-                agent_id=agent_id,
-                project_id=project_id
-            )
 
-            assert result["success"] is True
-            assert "project_info" in result
-            assert result["project_info"]["project_id"] == project_id
-            assert result["project_info"]["project_name"] == "Test Project"
-            assert "agent_context" in result
-            assert result["agent_context"]["agent_id"] == agent_id
-            assert result["agent_context"]["is_returning"] is False
+async def _run_onboarding(agent_id, project_id):
+    """Fetch the onboarding context for an agent in a project."""
+    return await onboarding_tools.get_project_onboarding_context(
+        agent_id=agent_id,
+        project_id=project_id
+    )
 
-    @pytest.mark.asyncio
-    async def test_onboarding_success_returning_agent(self, memory_store, context_manager, fresh_temp_dir):
-        """Test onboarding context for a returning agent."""
-        from coordmcp.tools import onboarding_tools
 
-        workspace = fresh_temp_dir / "test_workspace"
-        workspace.mkdir()
+@pytest.fixture
+def setup_project(memory_store, shared_workspace):
+    """Helper to create a test project; extra keyword arguments go to create_project."""
+    def _create(name, workspace_name, **kwargs):
+        workspace = shared_workspace / workspace_name
         project_id = memory_store.create_project(
-            project_name="Test Project",
-            workspace_path=str(workspace)
+            project_name=name,
+            workspace_path=str(workspace),
+            **kwargs
         )
+        return project_id, workspace
+    return _create
 
-        agent_id = context_manager.register_agent("TestAgent", "opencode")
-        context_manager.start_context(
-            agent_id=agent_id,
-            project_id=project_id,
-            objective="First task",
-            task_description="Initial work"
-        )
 
-        with patch.object(onboarding_tools, 'get_context_manager', return_value=context_manager), \
-             patch.object(onboarding_tools, 'get_memory_store', return_value=memory_store):
-            result = await onboarding_tools.get_project_onboarding_context(
-                agent_id=agent_id,
-                project_id=project_id
-            )
+@pytest.mark.unit
+@pytest.mark.onboarding
+@pytest.mark.xdist_group(name="get-project-onboarding-context")
+class TestGetProjectOnboardingContext:
+    """Test getting project onboarding context."""
+
+    @pytest.mark.asyncio
+    async def test_onboarding_success_new_agent(self, sample_project, sample_agent_id):
+        """Test onboarding context for a new agent in a project."""
+        project_id, _ = sample_project
+
+        result = await _run_onboarding(sample_agent_id, project_id)
 
-            assert result["success"] is True
-            assert result["agent_context"]["is_returning"] is True
+        assert result["success"] is True
+        assert "project_info" in result
+        assert result["project_info"]["project_id"] == project_id
+        assert result["project_info"]["project_name"] == "Test Project"
+        assert "agent_context" in result
+        assert result["agent_context"]["agent_id"] == sample_agent_id
+        assert result["agent_context"]["is_returning"] is False
 
     @pytest.mark.asyncio
-    async def test_onboarding_agent_not_found(self, memory_store, context_manager, fresh_temp_dir):
-        """Test onboarding returns error when agent not found."""
-        from coordmcp.tools import onboarding_tools
+    async def test_onboarding_success_returning_agent(self, context_manager, sample_project, sample_agent_id):
+        """Test onboarding context for a returning agent."""
+        project_id, _ = sample_project
 
-        workspace = fresh_temp_dir / "test_workspace"
-        workspace.mkdir()
-        project_id = memory_store.create_project(
-            project_name="Test Project",
-            workspace_path=str(workspace)
+        context_manager.start_context(
+            agent_id=sample_agent_id,
+            project_id=project_id,
+            objective="First task",
+            task_description="Initial work"
         )
 
-        with patch.object(onboarding_tools, 'get_context_manager', return_value=context_manager), \
-             patch.object(onboarding_tools, 'get_memory_store', return_value=memory_store):
-            result = await onboarding_tools.get_project_onboarding_context(
-                agent_id="nonexistent_agent",
-                project_id=project_id
-            )
+        result = await _run_onboarding(sample_agent_id, project_id)
 
-            assert result["success"] is False
-            assert result["error_type"] == "AgentNotFound"
-            assert "not found" in result["error"].lower()
+        assert result["success"] is True
+        assert result["agent_context"]["is_returning"] is True
 
+    @pytest.mark.parametrize("agent_id,project_id,error_type", [
+        ("nonexistent_agent", None, "AgentNotFound"),
+        (None, "nonexistent_project", "ProjectNotFound"),
+    ], ids=["agent", "project"])
     @pytest.mark.asyncio
-    async def test_onboarding_project_not_found(self, memory_store, context_manager):
-        """Test onboarding returns error when project not found."""
-        from coordmcp.tools import onboarding_tools
-
-        agent_id = context_manager.register_agent("TestAgent", "opencode")
-
-        with patch.object(onboarding_tools, 'get_context_manager', return_value=context_manager), \
-             patch.object(onboarding_tools, 'get_memory_store', return_value=memory_store):
-            result = await onboarding_tools.get_project_onboarding_context(
-                agent_id=agent_id,
-                project_id="nonexistent_project"
-            )
+    async def test_onboarding_not_found(self, sample_project_id, sample_agent_id, agent_id, project_id, error_type):
+        """Test onboarding returns an error when the agent or project is missing (None means the real one)."""
+        result = await _run_onboarding(agent_id or sample_agent_id, project_id or sample_project_id)
 
-            assert result["success"] is False
-            assert result["error_type"] == "ProjectNotFound"
-            assert "not found" in result["error"].lower()
+        assert result["success"] is False
+        assert result["error_type"] == error_type
+        assert "not found" in result["error"].lower()
 
     @pytest.mark.asyncio
-    async def test_onboarding_returns_active_agents(self, memory_store, context_manager, fresh_temp_dir):
+    async def test_onboarding_returns_active_agents(self, context_manager, setup_project):
         """Test that onboarding returns active agents in the project."""
-        from coordmcp.tools import onboarding_tools
-
-        workspace = fresh_temp_dir / "test_workspace"
-        workspace.mkdir()
-        project_id = memory_store.create_project(
-            project_name="Test Project",
-            workspace_path=str(workspace)
-        )
+        project_id, _ = setup_project("Test Project", "test_workspace")
 
         agent_id1 = context_manager.register_agent("Agent1", "opencode")
         agent_id2 = context_manager.register_agent("Agent2", "cursor")
 
-        context_manager.start_context(
-            agent_id=agent_id1,
-            project_id=project_id,
-            objective="Task 1"
-        )
-        context_manager.start_context(
-            agent_id=agent_id2,
-            project_id=project_id,
-            objective="Task 2"
-        )
-
-        with patch.object(onboarding_tools, 'get_context_manager', return_value=context_manager), \
-             patch.object(onboarding_tools, 'get_memory_store', return_value=memory_store):
-            result = await onboarding_tools.get_project_onboarding_context(
-                agent_id=agent_id1,
-                project_id=project_id
+        # Started one after another: start_context read-modify-writes the shared
+        # agent registry, so running these concurrently would lose updates
+        for i, agent_id in enumerate((agent_id1, agent_id2), start=1):
+            context_manager.start_context(
+                agent_id=agent_id,
+                project_id=project_id,
+                objective=f"Task {i}"
             )
 
-            assert result["success"] is True
-            assert "active_agents" in result
-            assert len(result["active_agents"]) >= 2
+        result = await _run_onboarding(agent_id1, project_id)
+
+        assert result["success"] is True
+        assert "active_agents" in result
+        assert len(result["active_agents"]) >= 2
 
     @pytest.mark.asyncio
-    async def test_onboarding_returns_recent_changes(self, memory_store, context_manager, fresh_temp_dir):
+    async def test_onboarding_returns_recent_changes(self, memory_store, setup_project, sample_agent_id):
         """Test that onboarding returns recent changes in the project."""
-        from coordmcp.tools import onboarding_tools
-        from coordmcp.memory.models import Change, ChangeType
-        from uuid import uuid4
+        project_id, _ = setup_project("Test Project", "test_workspace")
 
-        workspace = fresh_temp_dir / "test_workspace"
-        workspace.mkdir()
-        project_id = memory_store.create_project(
-            project_name="Test Project",
-            workspace_path=str(workspace)
-        )
-
-        change = Change(
-            id=str(uuid4()),
-            file_path="src/main.py",
+        change = ChangeFactory.create(
+            id=_fake_id(),
             change_type=ChangeType.MODIFY,
             description="Added new feature",
             agent_id="test_agent"
         )
         memory_store.log_change(project_id, change)
 
-        agent_id = context_manager.register_agent("TestAgent", "opencode")
+        result = await _run_onboarding(sample_agent_id, project_id)
 
-        with patch.object(onboarding_tools, 'get_context_manager', return_value=context_manager), \
-             patch.object(onboarding_tools, 'get_memory_store', return_value=memory_store):
-            result = await onboarding_tools.get_project_onboarding_context(
-                agent_id=agent_id,
-                project_id=project_id
-            )
-
-            assert result["success"] is True
-            assert "recent_changes" in result
+        assert result["success"] is True
+        assert "recent_changes" in result
 
     @pytest.mark.asyncio
-    async def test_onboarding_returns_recommended_steps(self, memory_store, context_manager, fresh_temp_dir):
+    async def test_onboarding_returns_recommended_steps(self, sample_project, sample_agent_id):
         """Test that onboarding returns recommended next steps."""
-        from coordmcp.tools import onboarding_tools
+        project_id, _ = sample_project
 
-        workspace = fresh_temp_dir / "test_workspace"
-        workspace.mkdir()
-        project_id = memory_store.create_project(
-            project_name="Test Project",
-            workspace_path=str(workspace)
-        )
+        result = await _run_onboarding(sample_agent_id, project_id)
 
-        agent_id = context_manager.register_agent("TestAgent", "opencode")
-
-        with patch.object(onboarding_tools, 'get_context_manager', return_value=context_manager), \
-             patch.object(onboarding_tools, 'get_memory_store', return_value=memory_store):
-            result = await onboarding_tools.get_project_onboarding_context(
-                agent_id=agent_id,
-                project_id=project_id
-            )
-
-            assert result["success"] is True
-            assert "recommended_next_steps" in result
-            assert len(result["recommended_next_steps"]) > 0
+        assert result["success"] is True
+        assert "recommended_next_steps" in result
+        assert len(result["recommended_next_steps"]) > 0
 
 
 @pytest.mark.unit
 @pytest.mark.onboarding
+@pytest.mark.xdist_group(name="build-project-info")
 class TestBuildProjectInfo:
     """Test project info building functions."""
 
-    def test_build_project_info_with_data(self, memory_store, fresh_temp_dir):
+    def test_build_project_info_with_data(self, memory_store, setup_project):
         """Test building project info with complete data."""
-        from coordmcp.tools import onboarding_tools
-
-        workspace = fresh_temp_dir / "test_workspace"
-        workspace.mkdir()
-        project_id = memory_store.create_project(
-            project_name="Test Project",
-            description="A test project",
-            workspace_path=str(workspace)
-        )
+        project_id, _ = setup_project("Test Project", "test_workspace", description="A test project")
 
         project_info = memory_store.get_project_info(project_id)
 
@@ -266,8 +186,6 @@ class TestBuildProjectInfo:
 
     def test_build_project_info_empty(self):
         """Test building project info with no data."""
-        from coordmcp.tools import onboarding_tools
-
         result = onboarding_tools._build_project_info(None, None)
 
         assert result == {}
@@ -275,182 +193,133 @@ class TestBuildProjectInfo:
 
 @pytest.mark.unit
 @pytest.mark.onboarding
+@pytest.mark.xdist_group(name="build-agent-context")
 class TestBuildAgentContext:
     """Test agent context building functions."""
 
-    def test_build_agent_context_new_agent(self, context_manager):
-        """Test building context for a new agent."""
-        from coordmcp.tools import onboarding_tools
-
-        agent_id = context_manager.register_agent("TestAgent", "opencode")
-        agent_profile = context_manager.get_agent(agent_id)
+    @pytest.mark.parametrize("involved,expected_returning", [
+        (False, False),
+        (True, True),
+    ], ids=["new", "returning"])
+    def test_build_agent_context(self, context_manager, sample_agent_id, involved, expected_returning):
+        """Test building context for a new agent and one already in the project."""
+        agent_profile = context_manager.get_agent(sample_agent_id)
+        if involved:
+            agent_profile.projects_involved.append("project_123")
 
         result = onboarding_tools._build_agent_context(agent_profile, "project_123")
 
-        assert result["agent_id"] == agent_id
+        assert result["agent_id"] == sample_agent_id
         assert result["agent_name"] == "TestAgent"
-        assert result["is_returning"] is False
-        assert result["previous_sessions_in_project"] == 0
-
-    def test_build_agent_context_returning_agent(self, context_manager):
-        """Test building context for a returning agent."""
-        from coordmcp.tools import onboarding_tools
-
-        agent_id = context_manager.register_agent("TestAgent", "opencode")
-        agent_profile = context_manager.get_agent(agent_id)
-        agent_profile.projects_involved.append("project_123")
-
-        result = onboarding_tools._build_agent_context(agent_profile, "project_123")
-
-        assert result["is_returning"] is True
+        assert result["is_returning"] is expected_returning
+        if not involved:
+            assert result["previous_sessions_in_project"] == 0
 
 
 @pytest.mark.unit
 @pytest.mark.onboarding
+@pytest.mark.xdist_group(name="get-workflow-guidance")
 class TestGetWorkflowGuidance:
     """Test workflow guidance functionality."""
 
+    @pytest.mark.parametrize("workflow_name,expected_name,display_name", [
+        (None, "default", "Standard Development Workflow"),
+        ("test-first", "test-first", "Test-First Development"),
+        ("feature-branch", "feature-branch", "Feature Branch Workflow"),
+    ])
     @pytest.mark.asyncio
-    async def test_get_workflow_guidance_default(self, memory_store, fresh_temp_dir):
-        """Test getting default workflow guidance."""
-        from coordmcp.tools import onboarding_tools
-
-        with patch.object(onboarding_tools, 'get_memory_store', return_value=memory_store):
-            result = await onboarding_tools.get_workflow_guidance()
-
-            assert result["success"] is True
-            assert result["workflow_name"] == "default"
-            assert result["workflow_display_name"] == "Standard Development Workflow"
-            assert "phases" in result
-            assert len(result["phases"]) > 0
-
-    @pytest.mark.asyncio
-    async def test_get_workflow_guidance_test_first(self, memory_store, fresh_temp_dir):
-        """Test getting test-first workflow guidance."""
-        from coordmcp.tools import onboarding_tools
+    async def test_get_workflow_guidance(self, workflow_name, expected_name, display_name):
+        """Test getting guidance for each built-in workflow (None means the default)."""
+        result = await onboarding_tools.get_workflow_guidance(workflow_name=workflow_name)
 
-        with patch.object(onboarding_tools, 'get_memory_store', return_value=memory_store):
-            result = await onboarding_tools.get_workflow_guidance(workflow_name="test-first")
-
-            assert result["success"] is True
-            assert result["workflow_name"] == "test-first"
-            assert result["workflow_display_name"] == "Test-First Development"
-
-    @pytest.mark.asyncio
-    async def test_get_workflow_guidance_feature_branch(self, memory_store, fresh_temp_dir):
-        """Test getting feature-branch workflow guidance."""
-        from coordmcp.tools import onboarding_tools
-
-        with patch.object(onboarding_tools, 'get_memory_store', return_value=memory_store):
-            result = await onboarding_tools.get_workflow_guidance(workflow_name="feature-branch")
-
-            assert result["success"] is True
-            assert result["workflow_name"] == "feature-branch"
-            assert result["workflow_display_name"] == "Feature Branch Workflow"
+        assert result["success"] is True
+        assert result["workflow_name"] == expected_name
+        assert result["workflow_display_name"] == display_name
+        assert "phases" in result
+        assert len(result["phases"]) > 0
 
     @pytest.mark.asyncio
-    async def test_get_workflow_guidance_with_project(self, memory_store, fresh_temp_dir):
+    async def test_get_workflow_guidance_with_project(self, setup_project):
         """Test getting workflow guidance with project context."""
-        from coordmcp.tools import onboarding_tools
-
-        workspace = fresh_temp_dir / "test_workspace"
-        workspace.mkdir()
-        project_id = memory_store.create_project(
-            project_name="Test Project",
-            workspace_path=str(workspace),
+        project_id, _ = setup_project(
+            "Test Project", "test_workspace",
             recommended_workflows=["test-first", "feature-branch"]
         )
 
-        with patch.object(onboarding_tools, 'get_memory_store', return_value=memory_store):
-            result = await onboarding_tools.get_workflow_guidance(project_id=project_id)
+        result = await onboarding_tools.get_workflow_guidance(project_id=project_id)
 
-            assert result["success"] is True
-            assert "project_id" in result
-            assert "project_name" in result
-            assert result["project_name"] == "Test Project"
+        assert result["success"] is True
+        assert "project_id" in result
+        assert "project_name" in result
+        assert result["project_name"] == "Test Project"
 
     @pytest.mark.asyncio
-    async def test_get_workflow_guidance_invalid_name(self, memory_store, fresh_temp_dir):
+    async def test_get_workflow_guidance_invalid_name(self):
         """Test that invalid workflow name falls back to default."""
-        from coordmcp.tools import onboarding_tools
+        result = await onboarding_tools.get_workflow_guidance(workflow_name="nonexistent_workflow")
 
-        with patch.object(onboarding_tools, 'get_memory_store', return_value=memory_store):
-            result = await onboarding_tools.get_workflow_guidance(workflow_name="nonexistent_workflow")
-
-            assert result["success"] is True
-            assert result["is_default"] is True
+        assert result["success"] is True
+        assert result["is_default"] is True
 
 
 @pytest.mark.unit
 @pytest.mark.onboarding
+@pytest.mark.xdist_group(name="validate-workflow-state")
 class TestValidateWorkflowState:
     """Test workflow state validation functionality."""
 
     @pytest.mark.asyncio
-    async def test_validate_workflow_unregistered(self, context_manager):
+    async def test_validate_workflow_unregistered(self):
         """Test validation for unregistered agent."""
-        from coordmcp.tools import onboarding_tools
-
-        with patch.object(onboarding_tools, 'get_context_manager', return_value=context_manager):
-            result = await onboarding_tools.validate_workflow_state("nonexistent_agent")
+        result = await onboarding_tools.validate_workflow_state("nonexistent_agent")
 
-            assert result["success"] is True
-            assert result["current_state"] == "unregistered"
-            assert len(result["warnings"]) > 0
+        assert result["success"] is True
+        assert result["current_state"] == "unregistered"
+        assert len(result["warnings"]) > 0
 
     @pytest.mark.asyncio
-    async def test_validate_workflow_registered_no_context(self, context_manager):
+    async def test_validate_workflow_registered_no_context(self, sample_agent_id):
         """Test validation for registered agent without context."""
-        from coordmcp.tools import onboarding_tools
-
-        agent_id = context_manager.register_agent("TestAgent", "opencode")
+        result = await onboarding_tools.validate_workflow_state(sample_agent_id)
 
-        with patch.object(onboarding_tools, 'get_context_manager', return_value=context_manager):
-            result = await onboarding_tools.validate_workflow_state(agent_id)
-
-            assert result["success"] is True
-            assert result["has_active_context"] is False
-            assert len(result["warnings"]) > 0
+        assert result["success"] is True
+        assert result["has_active_context"] is False
+        assert len(result["warnings"]) > 0
 
     @pytest.mark.asyncio
-    async def test_validate_workflow_with_context(self, memory_store, context_manager, fresh_temp_dir):
+    async def test_validate_workflow_with_context(self, context_manager, sample_project, sample_agent_id):
         """Test validation for agent with active context."""
-        from coordmcp.tools import onboarding_tools
-
-        workspace = fresh_temp_dir / "test_workspace"
-        workspace.mkdir()
-        project_id = memory_store.create_project(
-            project_name="Test Project",
-            workspace_path=str(workspace)
-        )
+        project_id, _ = sample_project
 
-        agent_id = context_manager.register_agent("TestAgent", "opencode")
         context_manager.start_context(
-            agent_id=agent_id,
+            agent_id=sample_agent_id,
             project_id=project_id,
             objective="Test task"
         )
 
-        with patch.object(onboarding_tools, 'get_context_manager', return_value=context_manager):
-            result = await onboarding_tools.validate_workflow_state(agent_id)
+        result = await onboarding_tools.validate_workflow_state(sample_agent_id)
 
-            assert result["success"] is True
-            assert result["current_state"] == "context_started"
-            assert result["has_active_context"] is True
-            assert "context_started" in result["completed_steps"]
+        assert result["success"] is True
+        assert result["current_state"] == "context_started"
+        assert result["has_active_context"] is True
+        assert "context_started" in result["completed_steps"]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def system_prompt_result():
+    """The prompt is static, so build it once for the whole module."""
+    return await onboarding_tools.get_system_prompt()
 
 
 @pytest.mark.unit
 @pytest.mark.onboarding
+@pytest.mark.xdist_group(name="get-system-prompt")
 class TestGetSystemPrompt:
     """Test system prompt functionality."""
 
-    @pytest.mark.asyncio
-    async def test_get_system_prompt_returns_content(self):
+    def test_get_system_prompt_returns_content(self, system_prompt_result):
         """Test that get_system_prompt returns valid content."""
-        from coordmcp.tools import onboarding_tools
-
-        result = await onboarding_tools.get_system_prompt()
+        result = system_prompt_result
 
         assert result["success"] is True
         assert "system_prompt" in result
@@ -458,21 +327,15 @@ class TestGetSystemPrompt:
         assert "MANDATORY WORKFLOW" in result["system_prompt"]
         assert "CoordMCP" in result["system_prompt"]
 
-    @pytest.mark.asyncio
-    async def test_get_system_prompt_contains_workflow_steps(self):
+    def test_get_system_prompt_contains_workflow_steps(self, system_prompt_result):
         """Test that system prompt contains workflow steps."""
-        from coordmcp.tools import onboarding_tools
+        prompt = system_prompt_result["system_prompt"]
 
-        result = await onboarding_tools.get_system_prompt()
-        prompt = result["system_prompt"]
+        steps = ("register_agent", "start_context", "lock_files", "log_change", "unlock_files", "end_context")
+        missing = [step for step in steps if step not in prompt]
 
         assert "discover_project" in prompt or "create_project" in prompt
-        assert "register_agent" in prompt
-        assert "start_context" in prompt
-        assert "lock_files" in prompt
-        assert "log_change" in prompt
-        assert "unlock_files" in prompt
-        assert "end_context" in prompt
+        assert not missing, f"System prompt is missing workflow steps: {missing}"
 
 
 if __name__ == "__main__":
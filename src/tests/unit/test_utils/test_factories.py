@@ -0,0 +1,62 @@
+"""
+Unit tests for the test data factories.
+
+Tests the COORDMCP_FAST_FACTORIES mode, which builds models without
+Pydantic validation:
+- Factories return the real model types with their defaults
+- List fields are real, per-object lists
+- Validation is skipped only when the flag is set
+"""
+
+import importlib.util
+
+import pytest
+from pydantic import ValidationError
+
+from coordmcp.memory.models import Decision, DecisionStatus, Task
+from tests.utils import factories
+
+
+@pytest.fixture
+def fast_factories(monkeypatch):
+    """Load a separate copy of the factories module with the flag set."""
+    monkeypatch.setenv("COORDMCP_FAST_FACTORIES", "1")
+    spec = importlib.util.spec_from_file_location("fast_factories", factories.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.unit
+class TestFastFactories:
+    """Test factories with COORDMCP_FAST_FACTORIES=1."""
+
+    def test_flag_is_read_at_import(self, fast_factories):
+        """Test that the flag enables fast mode and the default stays off."""
+        assert fast_factories._FAST_FACTORIES is True
+        assert factories._FAST_FACTORIES is False
+
+    def test_creates_models_with_defaults(self, fast_factories):
+        """Test that fast mode returns the same models and values."""
+        decision = fast_factories.DecisionFactory.create()
+
+        assert isinstance(decision, Decision)
+        assert decision.status == DecisionStatus.ACTIVE
+        assert decision.title == "Test Decision"
+        assert decision.created_at is not None
+
+    def test_list_fields_are_per_object_lists(self, fast_factories):
+        """Test that tuple template defaults become separate lists."""
+        first, second = fast_factories.TaskFactory.create_batch(2)
+
+        assert isinstance(first, Task)
+        assert first.depends_on == [] and isinstance(first.depends_on, list)
+        first.depends_on.append("task-1")
+        assert second.depends_on == []
+
+    def test_skips_validation(self, fast_factories):
+        """Test that invalid overrides are only rejected without the flag."""
+        assert fast_factories.DecisionFactory.create(title="x").title == "x"
+
+        with pytest.raises(ValidationError):
+            factories.DecisionFactory.create(title="x")
@@ -21,6 +21,26 @@ from coordmcp.utils.project_resolver import (
 )
 
 
+@pytest.fixture
+def make_project(memory_store, fresh_temp_dir):
+    """
+    Create a workspace directory and a project registered at it.
+    
+    Returns a factory taking the project name and the workspace path
+    relative to fresh_temp_dir (nested paths are created as needed); it
+    returns ``(workspace, project_id)``.
+    """
+    def _make(name, subdir):
+        workspace = fresh_temp_dir / subdir
+        workspace.mkdir(parents=True, exist_ok=True)
+        project_id = memory_store.create_project(
+            project_name=name,
+            workspace_path=str(workspace)
+        )
+        return workspace, project_id
+    return _make
+
+
 @pytest.mark.unit
 class TestNormalizePath:
     """Test path normalization."""
@@ -42,6 +62,18 @@ class TestNormalizePath:
         path_with_dot = str(fresh_temp_dir / "subdir" / ".." / "file.txt")
         normalized = normalize_path(path_with_dot)
         assert ".." not in normalized
+    
+    def test_normalize_relative_follows_current_directory(self, fresh_temp_dir, monkeypatch):
+        """Test that cached normalization still resolves relative paths against the cwd."""
+        first = fresh_temp_dir / "first"
+        second = fresh_temp_dir / "second"
+        first.mkdir()
+        second.mkdir()
+        
+        monkeypatch.chdir(first)
+        assert normalize_path("project") == os.path.join(os.getcwd(), "project")
+        monkeypatch.chdir(second)
+        assert normalize_path("project") == os.path.join(os.getcwd(), "project")
 
 
 @pytest.mark.unit
@@ -90,14 +122,9 @@ class TestValidateWorkspacePath:
 class TestResolveProject:
     """Test project resolution by various identifiers."""
     
-    def test_resolve_by_project_id(self, memory_store, fresh_temp_dir):
+    def test_resolve_by_project_id(self, memory_store, make_project):
         """Test resolving project by ID."""
-        workspace = fresh_temp_dir / "project1"
-        workspace.mkdir()
-        project_id = memory_store.create_project(
-            project_name="Project One",
-            workspace_path=str(workspace)
-        )
+        _, project_id = make_project("Project One", "project1")
         
         success, project, message = resolve_project(
             memory_store=memory_store,
@@ -108,14 +135,9 @@ class TestResolveProject:
         assert project.project_id == project_id
         assert project.project_name == "Project One"
     
-    def test_resolve_by_project_name(self, memory_store, fresh_temp_dir):
+    def test_resolve_by_project_name(self, memory_store, make_project):
         """Test resolving project by name."""
-        workspace = fresh_temp_dir / "project2"
-        workspace.mkdir()
-        memory_store.create_project(
-            project_name="Unique Project Name",
-            workspace_path=str(workspace)
-        )
+        make_project("Unique Project Name", "project2")
         
         success, project, message = resolve_project(
             memory_store=memory_store,
@@ -125,38 +147,23 @@ class TestResolveProject:
         assert success
         assert project.project_name == "Unique Project Name"
     
-    def test_resolve_by_workspace_path(self, memory_store, fresh_temp_dir):
+    def test_resolve_by_workspace_path(self, memory_store, make_project):
         """Test resolving project by workspace path."""
-        workspace = fresh_temp_dir / "project3"
-        workspace.mkdir()
-        memory_store.create_project(
-            project_name="Project Three",
-            workspace_path=str(workspace)
-        )
+        workspace, _ = make_project("Project Three", "project3")
+        ws_str = str(workspace)
         
         success, project, message = resolve_project(
             memory_store=memory_store,
-            workspace_path=str(workspace)
+            workspace_path=ws_str
         )
         
         assert success
-        assert project.workspace_path == str(workspace)
+        assert project.workspace_path == ws_str
     
-    def test_resolve_priority_id_over_name(self, memory_store, fresh_temp_dir):
+    def test_resolve_priority_id_over_name(self, memory_store, make_project):
         """Test that project_id resolves correctly even with same name projects."""
-        workspace1 = fresh_temp_dir / "project_a"
-        workspace1.mkdir()
-        project_id = memory_store.create_project(
-            project_name="Same Name",
-            workspace_path=str(workspace1)
-        )
-        
-        workspace2 = fresh_temp_dir / "project_b"
-        workspace2.mkdir()
-        memory_store.create_project(
-            project_name="Same Name",
-            workspace_path=str(workspace2)
-        )
+        _, project_id = make_project("Same Name", "project_a")
+        make_project("Same Name", "project_b")
         
         # Should resolve by ID alone
         success, project, message = resolve_project(
@@ -167,21 +174,10 @@ class TestResolveProject:
         assert success
         assert project.project_id == project_id
     
-    def test_resolve_validates_matching_identifiers(self, memory_store, fresh_temp_dir):
+    def test_resolve_validates_matching_identifiers(self, memory_store, make_project):
         """Test that mismatched identifiers return error."""
-        workspace1 = fresh_temp_dir / "project_c"
-        workspace1.mkdir()
-        project_id1 = memory_store.create_project(
-            project_name="Project C",
-            workspace_path=str(workspace1)
-        )
-        
-        workspace2 = fresh_temp_dir / "project_d"
-        workspace2.mkdir()
-        memory_store.create_project(
-            project_name="Project D",
-            workspace_path=str(workspace2)
-        )
+        _, project_id1 = make_project("Project C", "project_c")
+        make_project("Project D", "project_d")
         
         # Mixing identifiers from different projects
         success, project, message = resolve_project(
@@ -217,14 +213,9 @@ class TestResolveProject:
 class TestDiscoverProjectByPath:
     """Test project discovery by directory path."""
     
-    def test_discover_exact_match(self, memory_store, fresh_temp_dir):
+    def test_discover_exact_match(self, memory_store, make_project):
         """Test discovering project with exact path match."""
-        workspace = fresh_temp_dir / "exact_match"
-        workspace.mkdir()
-        memory_store.create_project(
-            project_name="Exact Match Project",
-            workspace_path=str(workspace)
-        )
+        workspace, _ = make_project("Exact Match Project", "exact_match")
         
         found, project, message, distance = discover_project_by_path(
             memory_store=memory_store,
@@ -235,18 +226,12 @@ class TestDiscoverProjectByPath:
         assert distance == 0
         assert "exact" in message.lower()
     
-    def test_discover_parent_directory(self, memory_store, fresh_temp_dir):
+    def test_discover_parent_directory(self, memory_store, make_project):
         """Test discovering project from subdirectory."""
-        workspace = fresh_temp_dir / "parent_project"
-        workspace.mkdir()
+        workspace, _ = make_project("Parent Project", "parent_project")
         subdir = workspace / "src" / "components"
         subdir.mkdir(parents=True)
         
-        memory_store.create_project(
-            project_name="Parent Project",
-            workspace_path=str(workspace)
-        )
-        
         found, project, message, distance = discover_project_by_path(
             memory_store=memory_store,
             path=str(subdir)
@@ -270,46 +255,30 @@ class TestDiscoverProjectByPath:
         assert distance == -1
         assert "no project found" in message.lower()
     
-    def test_discover_uses_current_directory_by_default(self, memory_store, fresh_temp_dir):
+    def test_discover_uses_current_directory_by_default(self, memory_store, make_project, monkeypatch):
         """Test that discover uses current directory when path not provided."""
-        original_cwd = os.getcwd()
-        try:
-            workspace = fresh_temp_dir / "cwd_project"
-            workspace.mkdir()
-            os.chdir(workspace)
-            
-            memory_store.create_project(
-                project_name="CWD Project",
-                workspace_path=str(workspace)
-            )
-            
-            found, project, message, distance = discover_project_by_path(
-                memory_store=memory_store
-            )
-            
-            assert found
-            assert project.project_name == "CWD Project"
-        finally:
-            os.chdir(original_cwd)
+        workspace, _ = make_project("CWD Project", "cwd_project")
+        monkeypatch.chdir(workspace)
+        
+        found, project, message, distance = discover_project_by_path(
+            memory_store=memory_store
+        )
+        
+        assert found
+        assert project.project_name == "CWD Project"
 
 
 @pytest.mark.unit
 class TestGetProjectsByPath:
     """Test getting projects under a base path."""
     
-    def test_get_projects_recursive(self, memory_store, fresh_temp_dir):
+    def test_get_projects_recursive(self, memory_store, make_project, fresh_temp_dir):
         """Test getting all projects recursively."""
         base = fresh_temp_dir / "workspace"
-        base.mkdir()
         
         # Create multiple projects at different levels
         for i in range(3):
-            proj_dir = base / f"project{i}"
-            proj_dir.mkdir()
-            memory_store.create_project(
-                project_name=f"Project {i}",
-                workspace_path=str(proj_dir)
-            )
+            make_project(f"Project {i}", f"workspace/project{i}")
         
         projects = get_projects_by_path(
             memory_store=memory_store,
@@ -321,28 +290,15 @@ class TestGetProjectsByPath:
         project_names = {p.project_name for p in projects}
         assert project_names == {"Project 0", "Project 1", "Project 2"}
     
-    def test_get_projects_non_recursive(self, memory_store, fresh_temp_dir):
+    def test_get_projects_non_recursive(self, memory_store, make_project, fresh_temp_dir):
         """Test getting only direct child projects."""
         base = fresh_temp_dir / "workspace"
-        base.mkdir()
         
         # Create project at base level
-        proj1 = base / "project1"
-        proj1.mkdir()
-        memory_store.create_project(
-            project_name="Project 1",
-            workspace_path=str(proj1)
-        )
+        make_project("Project 1", "workspace/project1")
         
         # Create project in subdirectory
-        subdir = base / "subdir"
-        subdir.mkdir()
-        proj2 = subdir / "project2"
-        proj2.mkdir()
-        memory_store.create_project(
-            project_name="Project 2",
-            workspace_path=str(proj2)
-        )
+        make_project("Project 2", "workspace/subdir/project2")
         
         projects = get_projects_by_path(
             memory_store=memory_store,
@@ -353,19 +309,28 @@ class TestGetProjectsByPath:
         assert len(projects) == 1
         assert projects[0].project_name == "Project 1"
     
-    def test_get_projects_returns_sorted(self, memory_store, fresh_temp_dir):
+    def test_get_projects_skips_sibling_with_shared_prefix(self, memory_store, fresh_temp_dir):
+        """Test that a sibling directory whose name extends the base is not matched."""
+        base = fresh_temp_dir / "workspace"
+        memory_store.create_projects_bulk([
+            ("Inside", str(base / "project")),
+            ("Sibling", str(fresh_temp_dir / "workspace-other")),
+        ])
+        
+        projects = get_projects_by_path(
+            memory_store=memory_store,
+            base_path=str(base)
+        )
+        
+        assert [p.project_name for p in projects] == ["Inside"]
+    
+    def test_get_projects_returns_sorted(self, memory_store, make_project, fresh_temp_dir):
         """Test that projects are returned sorted by name."""
         base = fresh_temp_dir / "workspace"
-        base.mkdir()
         
         # Create projects in non-alphabetical order
         for name in ["Charlie", "Alpha", "Bravo"]:
-            proj_dir = base / name.lower()
-            proj_dir.mkdir()
-            memory_store.create_project(
-                project_name=name,
-                workspace_path=str(proj_dir)
-            )
+            make_project(name, f"workspace/{name.lower()}")
         
         projects = get_projects_by_path(
             memory_store=memory_store,
@@ -392,14 +357,9 @@ class TestIsWorkspacePathUnique:
         
         assert is_unique
     
-    def test_duplicate_path_returns_false(self, memory_store, fresh_temp_dir):
+    def test_duplicate_path_returns_false(self, memory_store, make_project):
         """Test that used path is not unique."""
-        workspace = fresh_temp_dir / "duplicate"
-        workspace.mkdir()
-        memory_store.create_project(
-            project_name="First Project",
-            workspace_path=str(workspace)
-        )
+        workspace, _ = make_project("First Project", "duplicate")
         
         is_unique = is_workspace_path_unique(
             memory_store=memory_store,
@@ -408,14 +368,9 @@ class TestIsWorkspacePathUnique:
         
         assert not is_unique
     
-    def test_can_exclude_own_project(self, memory_store, fresh_temp_dir):
+    def test_can_exclude_own_project(self, memory_store, make_project):
         """Test that we can exclude a project when checking uniqueness."""
-        workspace = fresh_temp_dir / "update_project"
-        workspace.mkdir()
-        project_id = memory_store.create_project(
-            project_name="Update Project",
-            workspace_path=str(workspace)
-        )
+        workspace, project_id = make_project("Update Project", "update_project")
         
         # Should be unique when excluding itself
         is_unique = is_workspace_path_unique(
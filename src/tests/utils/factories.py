@@ -5,13 +5,236 @@ Factories provide a convenient way to create test objects with sensible defaults
 while allowing easy customization through keyword arguments.
 """
 
-from datetime import datetime
-from uuid import uuid4
+import os
+import random
+import tempfile
+import threading
 from coordmcp.memory.models import (
     Decision, TechStackEntry, Change, FileMetadata,
     DecisionStatus, ChangeType, ArchitectureImpact, FileType, Complexity,
-    Task, AgentMessage, MessageType, SessionSummary, ActivityFeedItem
+    Task, TaskStatus, AgentMessage, MessageType, SessionSummary, ActivityFeedItem,
+    ProjectInfo, ArchitectureModule, Relationship, RelationshipType
 )
+from coordmcp.context.state import (
+    AgentContext, AgentProfile, AgentType, CurrentContext, Priority,
+    LockInfo, LockRequest
+)
+
+
+# Test IDs only need to be unique, not unpredictable, so they are cut from a
+# pool of pseudo-random bytes instead of reading os.urandom for every ID.
+_UUID_POOL_SIZE = 1024
+_uuid_rng = random.Random()
+_uuid_lock = threading.Lock()
+_uuid_pool = bytearray()
+_uuid_pos = 0
+
+
+def _take_uuid_bytes(count):
+    """Take ``16 * count`` bytes from the pool, refilling it if needed."""
+    global _uuid_pool, _uuid_pos
+    size = 16 * count
+    with _uuid_lock:
+        if _uuid_pos + size > len(_uuid_pool):
+            _uuid_pool = bytearray(
+                _uuid_rng.randbytes(16 * max(count, _UUID_POOL_SIZE))
+            )
+            _uuid_pos = 0
+        raw = _uuid_pool[_uuid_pos:_uuid_pos + size]
+        _uuid_pos += size
+    return raw
+
+
+def _format_uuid(b):
+    """Format 16 random bytes as a version 4 UUID string."""
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    h = b.hex()
+    return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+
+
+def _fast_uuid():
+    """Return a random version 4 UUID string."""
+    return _format_uuid(_take_uuid_bytes(1))
+
+
+def _fast_uuids(count):
+    """Return ``count`` random version 4 UUID strings from one pool read."""
+    raw = _take_uuid_bytes(count)
+    return [_format_uuid(raw[i:i + 16]) for i in range(0, 16 * count, 16)]
+
+
+# Pydantic validation is most of the cost of building a model. Setting
+# COORDMCP_FAST_FACTORIES=1 skips it for large fixture sets; it stays off by
+# default because tests pass plain strings for enum fields and rely on
+# validators such as ProjectInfo's workspace_path normalization.
+_FAST_FACTORIES = os.environ.get("COORDMCP_FAST_FACTORIES", "0") == "1"
+
+
+def _construct(model, fields):
+    """
+    Build a model instance, skipping validation in fast mode.
+    
+    List fields default to shared tuples in the templates below. Validation
+    copies them into new lists; fast mode has to do that itself.
+    """
+    if _FAST_FACTORIES:
+        return model.model_construct(**{
+            name: list(value) if type(value) is tuple else value
+            for name, value in fields.items()
+        })
+    return model(**fields)
+
+
+# Field values shared by every object a factory builds. They are created once
+# at import time; per-object values such as IDs are filled in by ``create``.
+_DECISION_DEFAULTS = {
+    "title": "Test Decision",
+    "description": "Test decision description",
+    "context": "Test context",
+    "rationale": "Test rationale",
+    "impact": "Test impact",
+    "status": DecisionStatus.ACTIVE,
+    "tags": ("test",),
+    "related_files": (),
+    "author_agent_id": "test-agent",
+    "version": 1,
+    "is_deleted": False
+}
+
+_TECH_STACK_ENTRY_DEFAULTS = {
+    "category": "backend",
+    "technology": "FastAPI",
+    "version": "0.100.0",
+    "rationale": "High performance framework",
+    "decision_ref": None
+}
+
+_CHANGE_DEFAULTS = {
+    "file_path": "src/main.py",
+    "change_type": ChangeType.CREATE,
+    "description": "Test change",
+    "code_summary": "Added main function",
+    "architecture_impact": ArchitectureImpact.MINOR,
+    "agent_id": "",
+    "impact_area": "",
+    "related_decision": None,
+    "version": 1,
+    "is_deleted": False
+}
+
+_FILE_METADATA_DEFAULTS = {
+    "id": "file_src/main.py",
+    "path": "src/main.py",
+    "file_type": FileType.SOURCE,
+    "module": "core",
+    "purpose": "Main entry point",
+    "lines_of_code": 50,
+    "complexity": Complexity.LOW,
+    "version": 1,
+    "is_deleted": False
+}
+
+_AGENT_CONTEXT_DEFAULTS = {
+    "agent_name": "Test Agent",
+    "agent_type": AgentType.OPENCODE
+}
+
+_CURRENT_CONTEXT_DEFAULTS = {
+    "current_objective": "Test objective",
+    "task_description": "Test task description",
+    "priority": Priority.MEDIUM,
+    "current_file": ""
+}
+
+_LOCK_INFO_DEFAULTS = {
+    "file_path": "src/main.py",
+    "locked_by": "agent-1",
+    "reason": "Testing",
+    "priority": 0
+}
+
+_AGENT_PROFILE_DEFAULTS = {
+    "agent_name": "Test Agent",
+    "agent_type": AgentType.OPENCODE,
+    "capabilities": ("python", "fastapi"),
+    "version": "1.0.0"
+}
+
+_TASK_DEFAULTS = {
+    "title": "Test Task",
+    "description": "Test task description",
+    "status": TaskStatus.PENDING,
+    "priority": "medium",
+    "related_files": (),
+    "depends_on": (),
+    "child_tasks": (),
+    "version": 1,
+    "is_deleted": False
+}
+
+_AGENT_MESSAGE_DEFAULTS = {
+    "from_agent_name": "Sender Agent",
+    "message_type": MessageType.UPDATE,
+    "content": "Test message content",
+    "read": False,
+    "version": 1,
+    "is_deleted": False
+}
+
+_SESSION_SUMMARY_DEFAULTS = {
+    "duration_minutes": 30,
+    "objective": "Test objective",
+    "objectives_completed": (),
+    "files_modified": (),
+    "key_decisions_made": (),
+    "blockers_encountered": (),
+    "summary_text": "Test session summary"
+}
+
+_ACTIVITY_FEED_ITEM_DEFAULTS = {
+    "activity_type": "task_created",
+    "agent_name": "Test Agent",
+    "summary": "Test activity summary",
+    "related_entity_id": None,
+    "related_entity_type": None,
+    "version": 1,
+    "is_deleted": False
+}
+
+_LOCK_REQUEST_DEFAULTS = {
+    "file_path": "src/main.py",
+    "agent_name": "Test Agent",
+    "reason": "Testing",
+    "priority": 0
+}
+
+# The temp directory is resolved once; each project gets its own subdirectory.
+_PROJECT_WORKSPACE_PREFIX = os.path.join(tempfile.gettempdir(), "test_project_")
+
+_PROJECT_INFO_DEFAULTS = {
+    "project_name": "Test Project",
+    "description": "Test project description",
+    "version": 1,
+    "is_deleted": False
+}
+
+_ARCHITECTURE_MODULE_DEFAULTS = {
+    "name": "core",
+    "purpose": "Core functionality",
+    "files": ("src/core/main.py",),
+    "dependencies": (),
+    "dependents": (),
+    "responsibilities": ("Handle core logic",)
+}
+
+_RELATIONSHIP_DEFAULTS = {
+    "source_type": "decision",
+    "target_type": "file",
+    "target_id": "src/main.py",
+    "relationship_type": RelationshipType.REFERENCES,
+    "created_by": "test-agent"
+}
 
 
 class DecisionFactory:
@@ -28,22 +251,26 @@ class DecisionFactory:
         Returns:
             Decision instance
         """
-        defaults = {
-            "id": str(uuid4()),
-            "title": "Test Decision",
-            "description": "Test decision description",
-            "context": "Test context",
-            "rationale": "Test rationale",
-            "impact": "Test impact",
-            "status": DecisionStatus.ACTIVE,
-            "tags": ["test"],
-            "related_files": [],
-            "author_agent_id": "test-agent",
-            "version": 1,
-            "is_deleted": False
-        }
-        defaults.update(overrides)
-        return Decision(**defaults)
+        defaults = {**_DECISION_DEFAULTS, "id": _fast_uuid(), **overrides}
+        return _construct(Decision, defaults)
+    
+    @staticmethod
+    def create_batch(count, **overrides):
+        """
+        Create several Decisions sharing the same overrides.
+        
+        Args:
+            count: Number of decisions to create
+            **overrides: Field values to override defaults
+            
+        Returns:
+            List of Decision instances, each with its own ID
+        """
+        base = {**_DECISION_DEFAULTS, **overrides}
+        return [
+            _construct(Decision, {"id": decision_id, **base})
+            for decision_id in _fast_uuids(count)
+        ]
 
 
 class TechStackEntryFactory:
@@ -60,15 +287,8 @@ class TechStackEntryFactory:
         Returns:
             TechStackEntry instance
         """
-        defaults = {
-            "category": "backend",
-            "technology": "FastAPI",
-            "version": "0.100.0",
-            "rationale": "High performance framework",
-            "decision_ref": None
-        }
-        defaults.update(overrides)
-        return TechStackEntry(**defaults)
+        defaults = {**_TECH_STACK_ENTRY_DEFAULTS, **overrides}
+        return _construct(TechStackEntry, defaults)
 
 
 class ChangeFactory:
@@ -85,21 +305,26 @@ class ChangeFactory:
         Returns:
             Change instance
         """
-        defaults = {
-            "id": str(uuid4()),
-            "file_path": "src/main.py",
-            "change_type": ChangeType.CREATE,
-            "description": "Test change",
-            "code_summary": "Added main function",
-            "architecture_impact": ArchitectureImpact.MINOR,
-            "agent_id": "",
-            "impact_area": "",
-            "related_decision": None,
-            "version": 1,
-            "is_deleted": False
-        }
-        defaults.update(overrides)
-        return Change(**defaults)
+        defaults = {**_CHANGE_DEFAULTS, "id": _fast_uuid(), **overrides}
+        return _construct(Change, defaults)
+    
+    @staticmethod
+    def create_batch(count, **overrides):
+        """
+        Create several Changes sharing the same overrides.
+        
+        Args:
+            count: Number of changes to create
+            **overrides: Field values to override defaults
+            
+        Returns:
+            List of Change instances, each with its own ID
+        """
+        base = {**_CHANGE_DEFAULTS, **overrides}
+        return [
+            _construct(Change, {"id": change_id, **base})
+            for change_id in _fast_uuids(count)
+        ]
 
 
 class FileMetadataFactory:
@@ -116,20 +341,10 @@ class FileMetadataFactory:
         Returns:
             FileMetadata instance
         """
-        path = overrides.get("path", "src/main.py")
-        defaults = {
-            "id": f"file_{path}",
-            "path": path,
-            "file_type": FileType.SOURCE,
-            "module": "core",
-            "purpose": "Main entry point",
-            "lines_of_code": 50,
-            "complexity": Complexity.LOW,
-            "version": 1,
-            "is_deleted": False
-        }
-        defaults.update(overrides)
-        return FileMetadata(**defaults)
+        defaults = {**_FILE_METADATA_DEFAULTS, **overrides}
+        if "path" in overrides and "id" not in overrides:
+            defaults["id"] = f"file_{overrides['path']}"
+        return _construct(FileMetadata, defaults)
 
 
 class AgentContextFactory:
@@ -146,16 +361,14 @@ class AgentContextFactory:
         Returns:
             AgentContext instance
         """
-        from coordmcp.context.state import AgentContext, AgentType
-        
+        agent_id, session_id = _fast_uuids(2)
         defaults = {
-            "agent_id": str(uuid4()),
-            "agent_name": "Test Agent",
-            "agent_type": AgentType.OPENCODE,
-            "session_id": str(uuid4())
+            **_AGENT_CONTEXT_DEFAULTS,
+            "agent_id": agent_id,
+            "session_id": session_id,
+            **overrides
         }
-        defaults.update(overrides)
-        return AgentContext(**defaults)
+        return _construct(AgentContext, defaults)
 
 
 class CurrentContextFactory:
@@ -172,17 +385,12 @@ class CurrentContextFactory:
         Returns:
             CurrentContext instance
         """
-        from coordmcp.context.state import CurrentContext, Priority
-        
         defaults = {
-            "project_id": str(uuid4()),
-            "current_objective": "Test objective",
-            "task_description": "Test task description",
-            "priority": Priority.MEDIUM,
-            "current_file": ""
+            **_CURRENT_CONTEXT_DEFAULTS,
+            "project_id": _fast_uuid(),
+            **overrides
         }
-        defaults.update(overrides)
-        return CurrentContext(**defaults)
+        return _construct(CurrentContext, defaults)
 
 
 class LockInfoFactory:
@@ -199,16 +407,8 @@ class LockInfoFactory:
         Returns:
             LockInfo instance
         """
-        from coordmcp.context.state import LockInfo
-        
-        defaults = {
-            "file_path": "src/main.py",
-            "locked_by": "agent-1",
-            "reason": "Testing",
-            "priority": 0
-        }
-        defaults.update(overrides)
-        return LockInfo(**defaults)
+        defaults = {**_LOCK_INFO_DEFAULTS, **overrides}
+        return _construct(LockInfo, defaults)
 
 
 class AgentProfileFactory:
@@ -225,17 +425,12 @@ class AgentProfileFactory:
         Returns:
             AgentProfile instance
         """
-        from coordmcp.context.state import AgentProfile, AgentType
-        
         defaults = {
-            "agent_id": str(uuid4()),
-            "agent_name": "Test Agent",
-            "agent_type": AgentType.OPENCODE,
-            "capabilities": ["python", "fastapi"],
-            "version": "1.0.0"
+            **_AGENT_PROFILE_DEFAULTS,
+            "agent_id": _fast_uuid(),
+            **overrides
         }
-        defaults.update(overrides)
-        return AgentProfile(**defaults)
+        return _construct(AgentProfile, defaults)
 
 
 class TaskFactory:
@@ -252,23 +447,37 @@ class TaskFactory:
         Returns:
             Task instance
         """
-        from coordmcp.memory.models import Task, TaskStatus
-        
+        task_id, project_id = _fast_uuids(2)
         defaults = {
-            "id": str(uuid4()),
-            "title": "Test Task",
-            "description": "Test task description",
-            "status": TaskStatus.PENDING,
-            "project_id": str(uuid4()),
-            "priority": "medium",
-            "related_files": [],
-            "depends_on": [],
-            "child_tasks": [],
-            "version": 1,
-            "is_deleted": False
+            **_TASK_DEFAULTS,
+            "id": task_id,
+            "project_id": project_id,
+            **overrides
         }
-        defaults.update(overrides)
-        return Task(**defaults)
+        return _construct(Task, defaults)
+    
+    @staticmethod
+    def create_batch(count, **overrides):
+        """
+        Create several Tasks sharing the same overrides.
+        
+        Args:
+            count: Number of tasks to create
+            **overrides: Field values to override defaults
+            
+        Returns:
+            List of Task instances, each with its own ID
+        """
+        base = {**_TASK_DEFAULTS, **overrides}
+        ids = _fast_uuids(2 * count)
+        return [
+            _construct(Task, {
+                "id": task_id,
+                "project_id": project_id,
+                **base
+            })
+            for task_id, project_id in zip(ids[0::2], ids[1::2])
+        ]
 
 
 class AgentMessageFactory:
@@ -285,22 +494,43 @@ class AgentMessageFactory:
         Returns:
             AgentMessage instance
         """
-        from coordmcp.memory.models import AgentMessage, MessageType
-        
+        message_id, from_agent_id, to_agent_id, project_id = _fast_uuids(4)
         defaults = {
-            "id": str(uuid4()),
-            "from_agent_id": str(uuid4()),
-            "from_agent_name": "Sender Agent",
-            "to_agent_id": str(uuid4()),
-            "project_id": str(uuid4()),
-            "message_type": MessageType.UPDATE,
-            "content": "Test message content",
-            "read": False,
-            "version": 1,
-            "is_deleted": False
+            **_AGENT_MESSAGE_DEFAULTS,
+            "id": message_id,
+            "from_agent_id": from_agent_id,
+            "to_agent_id": to_agent_id,
+            "project_id": project_id,
+            **overrides
         }
-        defaults.update(overrides)
-        return AgentMessage(**defaults)
+        return _construct(AgentMessage, defaults)
+    
+    @staticmethod
+    def create_batch(count, **overrides):
+        """
+        Create several AgentMessages sharing the same overrides.
+        
+        Args:
+            count: Number of messages to create
+            **overrides: Field values to override defaults
+            
+        Returns:
+            List of AgentMessage instances, each with its own ID
+        """
+        base = {**_AGENT_MESSAGE_DEFAULTS, **overrides}
+        ids = _fast_uuids(4 * count)
+        return [
+            _construct(AgentMessage, {
+                "id": message_id,
+                "from_agent_id": from_agent_id,
+                "to_agent_id": to_agent_id,
+                "project_id": project_id,
+                **base
+            })
+            for message_id, from_agent_id, to_agent_id, project_id in zip(
+                ids[0::4], ids[1::4], ids[2::4], ids[3::4]
+            )
+        ]
 
 
 class SessionSummaryFactory:
@@ -317,21 +547,16 @@ class SessionSummaryFactory:
         Returns:
             SessionSummary instance
         """
+        summary_id, agent_id, project_id, session_id = _fast_uuids(4)
         defaults = {
-            "id": str(uuid4()),
-            "agent_id": str(uuid4()),
-            "project_id": str(uuid4()),
-            "session_id": str(uuid4()),
-            "duration_minutes": 30,
-            "objective": "Test objective",
-            "objectives_completed": [],
-            "files_modified": [],
-            "key_decisions_made": [],
-            "blockers_encountered": [],
-            "summary_text": "Test session summary"
+            **_SESSION_SUMMARY_DEFAULTS,
+            "id": summary_id,
+            "agent_id": agent_id,
+            "project_id": project_id,
+            "session_id": session_id,
+            **overrides
         }
-        defaults.update(overrides)
-        return SessionSummary(**defaults)
+        return _construct(SessionSummary, defaults)
 
 
 class ActivityFeedItemFactory:
@@ -348,20 +573,15 @@ class ActivityFeedItemFactory:
         Returns:
             ActivityFeedItem instance
         """
+        item_id, agent_id, project_id = _fast_uuids(3)
         defaults = {
-            "id": str(uuid4()),
-            "activity_type": "task_created",
-            "agent_id": str(uuid4()),
-            "agent_name": "Test Agent",
-            "project_id": str(uuid4()),
-            "summary": "Test activity summary",
-            "related_entity_id": None,
-            "related_entity_type": None,
-            "version": 1,
-            "is_deleted": False
+            **_ACTIVITY_FEED_ITEM_DEFAULTS,
+            "id": item_id,
+            "agent_id": agent_id,
+            "project_id": project_id,
+            **overrides
         }
-        defaults.update(overrides)
-        return ActivityFeedItem(**defaults)
+        return _construct(ActivityFeedItem, defaults)
 
 
 class LockRequestFactory:
@@ -378,19 +598,15 @@ class LockRequestFactory:
         Returns:
             LockRequest instance
         """
-        from coordmcp.context.state import LockRequest
-        
+        request_id, agent_id, project_id = _fast_uuids(3)
         defaults = {
-            "id": str(uuid4()),
-            "file_path": "src/main.py",
-            "agent_id": str(uuid4()),
-            "agent_name": "Test Agent",
-            "reason": "Testing",
-            "priority": 0,
-            "project_id": str(uuid4())
+            **_LOCK_REQUEST_DEFAULTS,
+            "id": request_id,
+            "agent_id": agent_id,
+            "project_id": project_id,
+            **overrides
         }
-        defaults.update(overrides)
-        return LockRequest(**defaults)
+        return _construct(LockRequest, defaults)
 
 
 class ProjectInfoFactory:
@@ -407,24 +623,15 @@ class ProjectInfoFactory:
         Returns:
             ProjectInfo instance
         """
-        from coordmcp.memory.models import ProjectInfo
-        import tempfile
-        import os
-        
-        tmpdir = tempfile.gettempdir()
-        workspace = os.path.join(tmpdir, f"test_project_{uuid4().hex[:8]}")
-        
+        info_id, project_id, suffix = _fast_uuids(3)
         defaults = {
-            "id": str(uuid4()),
-            "project_id": str(uuid4()),
-            "project_name": "Test Project",
-            "description": "Test project description",
-            "workspace_path": workspace,
-            "version": 1,
-            "is_deleted": False
+            **_PROJECT_INFO_DEFAULTS,
+            "id": info_id,
+            "project_id": project_id,
+            "workspace_path": _PROJECT_WORKSPACE_PREFIX + suffix[:8],
+            **overrides
         }
-        defaults.update(overrides)
-        return ProjectInfo(**defaults)
+        return _construct(ProjectInfo, defaults)
 
 
 class ArchitectureModuleFactory:
@@ -441,18 +648,8 @@ class ArchitectureModuleFactory:
         Returns:
             ArchitectureModule instance
         """
-        from coordmcp.memory.models import ArchitectureModule
-        
-        defaults = {
-            "name": "core",
-            "purpose": "Core functionality",
-            "files": ["src/core/main.py"],
-            "dependencies": [],
-            "dependents": [],
-            "responsibilities": ["Handle core logic"]
-        }
-        defaults.update(overrides)
-        return ArchitectureModule(**defaults)
+        defaults = {**_ARCHITECTURE_MODULE_DEFAULTS, **overrides}
+        return _construct(ArchitectureModule, defaults)
 
 
 class RelationshipFactory:
@@ -469,15 +666,9 @@ class RelationshipFactory:
         Returns:
             Relationship instance
         """
-        from coordmcp.memory.models import Relationship, RelationshipType
-        
         defaults = {
-            "source_type": "decision",
-            "source_id": str(uuid4()),
-            "target_type": "file",
-            "target_id": "src/main.py",
-            "relationship_type": RelationshipType.REFERENCES,
-            "created_by": "test-agent"
+            **_RELATIONSHIP_DEFAULTS,
+            "source_id": _fast_uuid(),
+            **overrides
         }
-        defaults.update(overrides)
-        return Relationship(**defaults)
+        return _construct(Relationship, defaults)